@@ -3,6 +3,8 @@
 from .providers import OpenAILike, Bedrock
 from .tool_executor import ToolExecutor
 from .models import ChatResponse, ChatStreamResponse
+from .cache import SemanticCache
+from .utils import skip_validation
 from .exceptions import (
     UnifiedLLMError,
     ProviderError,
@@ -19,6 +21,8 @@ __all__ = [
     "ToolExecutor",
     "ChatResponse", 
     "ChatStreamResponse",
+    "SemanticCache",
+    "skip_validation",
     "UnifiedLLMError",
     "ProviderError",
     "ToolExecutionError", 
@@ -1,11 +1,12 @@
 """Base provider abstract class for unified LLM interface."""
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple
+from typing import Callable, Dict, List, Any, AsyncIterator, Iterator, Optional, Tuple
 from .models import ChatResponse, ChatStreamResponse
 from .utils import extract_function_schema, validate_messages
 from .exceptions import ValidationError
-import json
 
 
 class BaseProvider(ABC):
@@ -160,6 +161,127 @@ class BaseProvider(ABC):
             parsed_chunk = self._parse_stream_response(chunk, enable_reasoning=enable_reasoning)
             yield parsed_chunk
     
+    async def achat(self, messages: List[Dict[str, Any]], enable_reasoning: bool = False) -> ChatResponse:
+        """Asynchronous chat completion with optional reasoning.
+        
+        Same contract as chat(); many calls can be awaited concurrently
+        (e.g. with asyncio.gather) without blocking the event loop.
+        
+        Args:
+            messages: List of message dictionaries in OpenAI-compatible format
+            enable_reasoning: Whether to enable reasoning content extraction
+            
+        Returns:
+            ChatResponse containing the completion result with tool_calls as data
+            
+        Raises:
+            ValidationError: If messages format is invalid
+            ProviderError: If provider API call fails
+        """
+        validate_messages(messages)
+        
+        request = self._prepare_request(messages, enable_reasoning=enable_reasoning)
+        
+        response = await self._aexecute_request(request)
+        
+        return self._parse_response(response, enable_reasoning=enable_reasoning)
+    
+    async def achat_stream(self, messages: List[Dict[str, Any]], enable_reasoning: bool = False) -> AsyncIterator[ChatStreamResponse]:
+        """Asynchronous streaming chat completion with optional reasoning.
+        
+        Args:
+            messages: List of message dictionaries in OpenAI-compatible format
+            enable_reasoning: Whether to enable reasoning content extraction
+            
+        Yields:
+            ChatStreamResponse chunks with tool_calls as data
+            
+        Raises:
+            ValidationError: If messages format is invalid
+            ProviderError: If provider API call fails
+        """
+        validate_messages(messages)
+        
+        request = self._prepare_request(messages, stream=True, enable_reasoning=enable_reasoning)
+        
+        async for chunk in self._aexecute_stream_request(request):
+            yield self._parse_stream_response(chunk, enable_reasoning=enable_reasoning)
+    
+    async def _aexecute_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute provider-specific API call without blocking the event loop.
+        
+        Default implementation runs the blocking _execute_request in a worker
+        thread. Providers with a native async client should override this.
+        
+        Args:
+            request: Provider-specific request
+            
+        Returns:
+            Provider-specific response
+            
+        Raises:
+            ProviderError: If API call fails
+        """
+        return await asyncio.to_thread(self._execute_request, request)
+    
+    async def _aexecute_stream_request(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Execute provider-specific streaming API call without blocking the event loop.
+        
+        Default implementation drains the blocking _execute_stream_request
+        iterator in one worker thread, which hands chunks to the event loop
+        through a queue (one thread hop per stream, not per chunk). Providers
+        with a native async client should override this.
+        
+        Args:
+            request: Provider-specific request
+            
+        Yields:
+            Provider-specific response chunks
+            
+        Raises:
+            ProviderError: If API call fails
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+        
+        def put(item: Tuple[Any, Optional[BaseException]]) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # Event loop already closed; nobody is listening any more
+                stop.set()
+        
+        def produce() -> None:
+            iterator = self._execute_stream_request(request)
+            try:
+                for chunk in iterator:
+                    if stop.is_set():
+                        break
+                    put((chunk, None))
+            except BaseException as e:
+                put((done, e))
+                return
+            finally:
+                close = getattr(iterator, 'close', None)
+                if close is not None:
+                    close()
+            put((done, None))
+        
+        loop.run_in_executor(None, produce)
+        try:
+            while True:
+                chunk, error = await queue.get()
+                if chunk is done:
+                    if error is not None:
+                        raise error
+                    break
+                yield chunk
+        finally:
+            # Consumer stopped early (break/cancel): let the producer wind down
+            stop.set()
+    
     @abstractmethod
     def _prepare_request(self, messages: List[Dict[str, Any]], stream: bool = False, enable_reasoning: bool = False) -> Dict[str, Any]:
         """Convert unified format to provider-specific format.
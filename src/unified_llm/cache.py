@@ -0,0 +1,33 @@
+"""Response cache interfaces for unified LLM interface."""
+
+from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class SemanticCache(Protocol):
+    """Pluggable cache that matches near-identical conversations.
+
+    Providers stay agnostic to the embedding/storage backend (sqlite-vec,
+    Redis, an in-memory vector index, ...). Implementations only need to map
+    a conversation to a previously stored raw provider response.
+    """
+
+    def lookup(self, messages: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return a cached raw provider response for messages, or None on miss.
+
+        Args:
+            messages: Messages in unified format
+
+        Returns:
+            Raw provider response dictionary, or None if nothing matches
+        """
+        ...
+
+    def store(self, messages: List[Dict[str, Any]], response: Dict[str, Any]) -> None:
+        """Store a raw provider response for messages.
+
+        Args:
+            messages: Messages in unified format
+            response: Raw provider response dictionary
+        """
+        ...
@@ -1,11 +1,249 @@
 """AWS Bedrock provider for unified LLM interface."""
 
-from typing import Dict, List, Any, Iterator, Optional, Callable, Tuple
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+import asyncio
+import base64
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Any, AsyncIterator, Iterator, Optional, Callable, Tuple
+from urllib.parse import quote
+import httpx
+import orjson
 from ...base import BaseProvider
 from ...models import ChatResponse, ChatStreamResponse
 from ...exceptions import ProviderError, ConfigurationError
+from ...utils import RateLimiter, retry_delay
+
+# boto3/botocore take hundreds of milliseconds to import; they are loaded on
+# first use so importing the package (or never touching Bedrock) stays cheap.
+if TYPE_CHECKING:
+    import boto3
+    from botocore.auth import SigV4Auth
+    from botocore.credentials import Credentials
+
+
+# Shared bedrock-runtime clients per (region, profile). boto3 clients are
+# thread-safe, but Sessions are not, so sessions are never shared: each
+# client is built from its own Session while holding the lock.
+_CLIENT_CACHE: Dict[Tuple[str, Optional[str]], 'boto3.client'] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_client(region_name: str, profile_name: Optional[str]) -> 'boto3.client':
+    """Return the shared bedrock-runtime client for a profile (None for the default chain).
+    
+    Building a client loads the service model from disk, so instances with
+    the same region and profile share one warm client. Clients for explicit
+    access keys are not cached here, so rotated temporary credentials are
+    not kept alive for the life of the process.
+    """
+    key = (region_name, profile_name)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        import boto3
+        
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                session = boto3.Session(profile_name=profile_name)
+                client = session.client('bedrock-runtime', region_name=region_name)
+                _CLIENT_CACHE[key] = client
+    return client
+
+
+# Transport errors raised before the request reached Bedrock; only these
+# are safe to retry
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Shared read-only default for .get() misses on the per-event stream path
+_EMPTY: Dict[str, Any] = {}
+
+
+def _encode_blob(value: Any) -> str:
+    """JSON encoder hook: Bedrock's REST API expects binary fields as base64."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode('ascii')
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _event_stream_error(headers: Dict[str, Any], payload: bytes) -> ProviderError:
+    """Convert a non-event AWS event-stream frame to ProviderError.
+    
+    'exception' frames name the modeled exception in :exception-type and
+    carry a JSON body; 'error' frames carry :error-code / :error-message
+    headers instead.
+    
+    Args:
+        headers: Decoded frame headers
+        payload: Raw frame payload
+        
+    Returns:
+        ProviderError describing the failure
+    """
+    if headers.get(':message-type') == 'error':
+        error_code = headers.get(':error-code', 'Unknown')
+        error_message = headers.get(':error-message', '')
+    else:
+        error_code = headers.get(':exception-type', 'Unknown')
+        try:
+            body = orjson.loads(payload) if payload else {}
+        except orjson.JSONDecodeError:
+            body = payload.decode('utf-8', 'replace')
+        if isinstance(body, dict):
+            error_message = body.get('message') or body.get('Message') or ''
+        else:
+            error_message = str(body)
+    
+    return ProviderError(f"Bedrock streaming API error [{error_code}]: {error_message}", provider="bedrock")
+
+
+class _BedrockStreamState:
+    """Per-stream context carried across ConverseStream events.
+    
+    Tool-use id and name only arrive on contentBlockStart; the deltas that
+    follow reference the block by contentBlockIndex. Argument fragments are
+    collected per block and joined once on contentBlockStop. The state lives
+    in the stream generator, so concurrent streams on one provider stay
+    independent.
+    """
+    
+    __slots__ = ('tool_calls', 'tool_args')
+    
+    def __init__(self):
+        self.tool_calls: Dict[int, Dict[str, Any]] = {}
+        self.tool_args: Dict[int, List[str]] = {}
+    
+    def annotate(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Track tool-use blocks across start, delta and stop events.
+        
+        Args:
+            event: Bedrock ConverseStream event ({event_type: payload})
+            
+        Returns:
+            The same event, with toolUseId/name set on tool-use deltas and the
+            complete tool call (JSON-string input) attached to its contentBlockStop
+        """
+        get = event.get
+        block = get('contentBlockDelta')
+        if block is not None:
+            tool_delta = block.get('delta', _EMPTY).get('toolUse')
+            if tool_delta is not None:
+                index = block.get('contentBlockIndex')
+                tool_use = self.tool_calls.get(index, _EMPTY)
+                tool_delta['toolUseId'] = tool_use.get('toolUseId')
+                tool_delta['name'] = tool_use.get('name')
+                self.tool_args.setdefault(index, []).append(tool_delta.get('input', ''))
+            return event
+        
+        block = get('contentBlockStart')
+        if block is not None:
+            tool_use = block.get('start', _EMPTY).get('toolUse')
+            if tool_use is not None:
+                self.tool_calls[block.get('contentBlockIndex')] = tool_use
+            return event
+        
+        block = get('contentBlockStop')
+        if block is not None:
+            index = block.get('contentBlockIndex')
+            tool_use = self.tool_calls.pop(index, None)
+            if tool_use is not None:
+                block['toolUse'] = {
+                    'toolUseId': tool_use.get('toolUseId'),
+                    'name': tool_use.get('name'),
+                    'input': ''.join(self.tool_args.pop(index, ())) or '{}'
+                }
+        
+        return event
+
+
+class _StreamCoalescer:
+    """Merge runs of small ConverseStream deltas into fewer, larger events.
+    
+    Consecutive text, reasoning-text or tool-input deltas for the same content
+    block are concatenated, up to max_events per merged event and, when
+    window_ms is set, until an event arrives more than window_ms after the
+    first buffered delta. The window is only checked as events arrive (there
+    is no timer), so buffered text waits for the next event or the end of the
+    stream. Any other event flushes the buffer first, so event order is preserved.
+    """
+    
+    __slots__ = ('max_events', 'window', '_first', '_key', '_parts', '_started')
+    
+    def __init__(self, max_events: int, window_ms: float = 0):
+        self.max_events = max_events
+        self.window = window_ms / 1000.0
+        self._first = None
+        self._key = None
+        self._parts: List[str] = []
+        self._started = 0.0
+    
+    @staticmethod
+    def _merge_key(event: Dict[str, Any]) -> Optional[Tuple[Any, str]]:
+        """Return (block index, delta kind) for mergeable deltas, else None."""
+        block = event.get('contentBlockDelta')
+        if block is None:
+            return None
+        delta = block.get('delta', _EMPTY)
+        if len(delta) != 1:
+            return None
+        kind = next(iter(delta))
+        if kind == 'text' or kind == 'toolUse':
+            return block.get('contentBlockIndex'), kind
+        if kind == 'reasoningContent' and delta[kind].keys() == {'text'}:
+            return block.get('contentBlockIndex'), kind
+        return None
+    
+    @staticmethod
+    def _piece(delta: Dict[str, Any], kind: str) -> str:
+        """Extract the concatenable string from a mergeable delta."""
+        if kind == 'text':
+            return delta['text']
+        if kind == 'toolUse':
+            return delta['toolUse'].get('input', '')
+        return delta['reasoningContent']['text']
+    
+    def _emit(self) -> Dict[str, Any]:
+        """Build the merged event for the current buffer and reset it."""
+        first, parts = self._first, self._parts
+        self._first, self._key, self._parts = None, None, []
+        if len(parts) == 1:
+            return first
+        
+        block = first['contentBlockDelta']
+        kind = next(iter(block['delta']))
+        joined = ''.join(parts)
+        if kind == 'text':
+            delta = {'text': joined}
+        elif kind == 'toolUse':
+            delta = {'toolUse': {**block['delta']['toolUse'], 'input': joined}}
+        else:
+            delta = {'reasoningContent': {'text': joined}}
+        return {'contentBlockDelta': {**block, 'delta': delta}}
+    
+    def push(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Add an event; return the events ready to be yielded (possibly none)."""
+        ready = []
+        key = self._merge_key(event)
+        
+        if self._first is not None:
+            expired = self.window and time.monotonic() - self._started > self.window
+            if key is None or key != self._key or expired:
+                ready.append(self._emit())
+        
+        if key is None:
+            ready.append(event)
+            return ready
+        
+        if self._first is None:
+            self._first, self._key, self._started = event, key, time.monotonic()
+        self._parts.append(self._piece(event['contentBlockDelta']['delta'], key[1]))
+        
+        if len(self._parts) >= self.max_events:
+            ready.append(self._emit())
+        return ready
+    
+    def flush(self) -> List[Dict[str, Any]]:
+        """Return any buffered event at end of stream."""
+        return [self._emit()] if self._first is not None else []
 
 
 class Bedrock(BaseProvider):
@@ -23,13 +261,23 @@ class Bedrock(BaseProvider):
     - Cross-region model access
     """
     
-
+    # Throttling and transient server errors worth retrying on the async path
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+    
+    # Common parameter -> Bedrock inferenceConfig key; everything else in
+    # config goes to additionalModelRequestFields
+    INFERENCE_CONFIG_KEYS = {
+        'temperature': 'temperature',
+        'max_tokens': 'maxTokens',
+        'top_p': 'topP',
+        'stop_sequences': 'stopSequences'
+    }
     
     def __init__(
         self, 
         model_id: str, 
         tools: Optional[List[Callable]] = None,
-        bedrock_client: Optional[boto3.client] = None,
+        bedrock_client: Optional['boto3.client'] = None,
         aws_profile: Optional[str] = None,
         region_name: Optional[str] = None,
         aws_access_key_id: Optional[str] = None,
@@ -51,6 +299,17 @@ class Bedrock(BaseProvider):
             **kwargs: Additional configuration parameters:
                 Common params: temperature, max_tokens, top_p, etc.
                 Bedrock-specific params: top_k, stop_sequences, reasoning_budget_tokens, etc.
+                Retry params (native async path): max_retries (default 3), backoff_base
+                (default 0.5s), backoff_max (default 30s); throttling/5xx
+                responses and connection failures are retried, errors after
+                the request was sent (e.g. read timeouts) are not. The sync
+                API and an injected bedrock_client go through boto3 and
+                rely on its retry configuration instead
+                Stream params: stream_buffer_size (default 1, no merging) merges
+                up to that many consecutive deltas into one chunk;
+                stream_coalesce_ms (default 0, no limit) stops merging into a
+                chunk once an event arrives that many ms after its first
+                delta. It is measured between arriving events, not on a timer
         """
         # Store authentication parameters for lazy client initialization
         self._bedrock_client = bedrock_client
@@ -60,17 +319,30 @@ class Bedrock(BaseProvider):
         self._aws_secret_access_key = aws_secret_access_key
         self._aws_session_token = aws_session_token
         
-        # Initialize client to None for lazy loading
+        # Initialize clients and credentials to None for lazy loading. The
+        # async client is rebuilt per event loop (its connections belong to one)
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
+        self._credentials = None
+        self._signer = None
         
         # Store Bedrock-specific configuration
         self.reasoning_budget_tokens = kwargs.pop('reasoning_budget_tokens', 2000)
+        self.max_retries = kwargs.pop('max_retries', 3)
+        self.backoff_base = kwargs.pop('backoff_base', 0.5)
+        self.backoff_max = kwargs.pop('backoff_max', 30.0)
+        self.stream_buffer_size = kwargs.pop('stream_buffer_size', 1)
+        self.stream_coalesce_ms = kwargs.pop('stream_coalesce_ms', 0)
         
         # Detect model capabilities based on model_id patterns
         self._detect_model_capabilities()
         
         # Call parent constructor
         super().__init__(model_id, tools, **kwargs)
+        
+        # Config and tools are fixed after construction; build their request fields once
+        self._static_fields = self._build_static_fields()
     
 
     def _detect_model_capabilities(self) -> None:
@@ -82,13 +354,13 @@ class Bedrock(BaseProvider):
         self.supports_tools = True
     
     @property
-    def client(self) -> boto3.client:
+    def client(self) -> 'boto3.client':
         """Get or initialize the Bedrock client with lazy loading."""
         if self._client is None:
             self._client = self._initialize_bedrock_client()
         return self._client
     
-    def _initialize_bedrock_client(self) -> boto3.client:
+    def _initialize_bedrock_client(self) -> 'boto3.client':
         """Initialize Bedrock client with flexible authentication.
         
         Authentication priority:
@@ -101,25 +373,282 @@ class Bedrock(BaseProvider):
         if self._bedrock_client is not None:
             return self._bedrock_client
         
-        # Priority 2: Use explicit AWS credentials if provided
+        # Priority 2: explicit credentials get a client of their own
         if self._aws_access_key_id:
-            return boto3.client(
-                'bedrock-runtime',
-                region_name=self._region_name,
+            import boto3
+            
+            session = boto3.Session(
                 aws_access_key_id=self._aws_access_key_id,
                 aws_secret_access_key=self._aws_secret_access_key,
                 aws_session_token=self._aws_session_token  # Can be None
             )
-        
-        # Priority 3: Use AWS profile if specified
-        if self._aws_profile:
-            session = boto3.Session(profile_name=self._aws_profile)
             return session.client('bedrock-runtime', region_name=self._region_name)
         
-        # Priority 4: Use default AWS credential chain
-        return boto3.client('bedrock-runtime', region_name=self._region_name)
+        # Priorities 3-4: profile or default chain, shared process-wide
+        return _get_cached_client(self._region_name, self._aws_profile)
+    
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Get the httpx client for the running event loop, creating it if needed.
+        
+        httpx.AsyncClient connections are bound to the loop they were opened
+        on, so each asyncio.run() (or other loop) gets a client of its own.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = self._new_async_client()
+            self._async_client_loop = loop
+        return self._async_client
+    
+    def _new_async_client(self) -> httpx.AsyncClient:
+        """Build an httpx client for the native async path."""
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            timeout=httpx.Timeout(60.0, read=300.0)
+        )
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        client, self._async_client = self._async_client, None
+        loop, self._async_client_loop = self._async_client_loop, None
+        # A client opened on another loop can't be closed from this one; its
+        # connections are dropped with it
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+    
+    def _get_credentials(self) -> 'Credentials':
+        """Resolve AWS credentials for request signing, once per provider.
+        
+        Follows the same priority as _initialize_bedrock_client (minus the
+        pre-configured client, which the native path does not use).
+        
+        Raises:
+            ConfigurationError: If no credentials can be resolved
+        """
+        if self._credentials is None:
+            from botocore.credentials import Credentials
+            
+            if self._aws_access_key_id:
+                credentials = Credentials(
+                    self._aws_access_key_id,
+                    self._aws_secret_access_key,
+                    self._aws_session_token
+                )
+            else:
+                import boto3
+                
+                # A private Session: Session objects must not be shared across threads
+                credentials = boto3.Session(profile_name=self._aws_profile).get_credentials()
+            
+            if credentials is None:
+                raise ConfigurationError("Unable to locate AWS credentials for Bedrock")
+            self._credentials = credentials
+        return self._credentials
+    
+    def _get_signer(self) -> 'SigV4Auth':
+        """Return the SigV4 signer for this provider, built once.
+        
+        The signer holds the (possibly refreshable) credentials object rather
+        than a frozen snapshot, so temporary credentials still refresh before
+        they expire; signing itself is then just the HMAC pass per request.
+        """
+        if self._signer is None:
+            from botocore.auth import SigV4Auth
+            
+            self._signer = SigV4Auth(self._get_credentials(), 'bedrock', self._region_name)
+        return self._signer
+    
+    def _signed_request(self, action: str, request: Dict[str, Any], accept: str) -> Tuple[str, bytes, Dict[str, str]]:
+        """Build a SigV4-signed Bedrock runtime HTTP request.
+        
+        Args:
+            action: Runtime API action ('converse' or 'converse-stream')
+            request: Bedrock Converse API request
+            accept: Accept header value
+            
+        Returns:
+            Tuple of (url, body, headers)
+        """
+        url = (
+            f"https://bedrock-runtime.{self._region_name}.amazonaws.com"
+            f"/model/{quote(request['modelId'], safe='')}/{action}"
+        )
+        # modelId travels in the URL; blobs (images, documents) are base64 on the wire
+        body = orjson.dumps(
+            {key: value for key, value in request.items() if key != 'modelId'},
+            default=_encode_blob
+        )
+        
+        from botocore.awsrequest import AWSRequest
+        
+        aws_request = AWSRequest(
+            method='POST',
+            url=url,
+            data=body,
+            headers={'Content-Type': 'application/json', 'Accept': accept}
+        )
+        self._get_signer().add_auth(aws_request)
+        return url, body, dict(aws_request.headers)
+    
+    @staticmethod
+    def _http_error(response: httpx.Response, streaming: bool = False) -> ProviderError:
+        """Convert a failed Bedrock HTTP response to ProviderError."""
+        error_code = response.headers.get('x-amzn-errortype', 'Unknown').split(':')[0]
+        try:
+            error_json = orjson.loads(response.content)
+        except ValueError:
+            error_json = None
+        if isinstance(error_json, dict):
+            error_message = error_json.get('message') or error_json.get('Message') or response.text
+        else:
+            error_message = response.text
+        
+        label = "Bedrock streaming API error" if streaming else "Bedrock API error"
+        return ProviderError(
+            f"{label} [{error_code}]: {error_message}",
+            provider="bedrock",
+            status_code=response.status_code
+        )
+    
+    async def _aexecute_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute Bedrock Converse API call over native async HTTP.
+        
+        Falls back to the threaded boto3 path when a pre-configured client
+        was injected, since its credentials are owned by that client. That
+        path does not use max_retries; the client's own botocore retry
+        configuration applies.
+        
+        Args:
+            request: Bedrock Converse API request
+            
+        Returns:
+            Bedrock Converse API response
+            
+        Raises:
+            ProviderError: If API call fails
+        """
+        if self._bedrock_client is not None:
+            return await super()._aexecute_request(request)
+        
+        url, body, headers = self._signed_request('converse', request, 'application/json')
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.async_client.post(url, content=body, headers=headers)
+            except httpx.HTTPError as e:
+                # Only retry if the request never reached Bedrock; after that
+                # the model may already be generating (and billing) the call
+                if attempt < self.max_retries and isinstance(e, _UNSENT_REQUEST_ERRORS):
+                    await asyncio.sleep(retry_delay(attempt, self.backoff_base, self.backoff_max))
+                    continue
+                raise ProviderError(f"Unexpected error calling Bedrock: {str(e)}", provider="bedrock")
+            
+            if response.status_code in self.RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                await asyncio.sleep(retry_delay(
+                    attempt, self.backoff_base, self.backoff_max, response.headers.get('Retry-After')
+                ))
+                continue
+            
+            if response.status_code != 200:
+                raise self._http_error(response)
+            
+            return orjson.loads(response.content)
+    
+    async def abatch(
+        self,
+        messages_list: List[List[Dict[str, Any]]],
+        max_per_second: Optional[float] = None,
+        max_at_once: int = 64,
+        enable_reasoning: bool = False,
+        return_exceptions: bool = True
+    ) -> List[Any]:
+        """Run many chat requests concurrently on one event loop.
+        
+        Args:
+            messages_list: One unified-format message list per request
+            max_per_second: Optional cap on request starts per second, to stay
+                under Bedrock account quotas
+            max_at_once: Maximum number of requests in flight
+            enable_reasoning: Enable reasoning mode for every request
+            return_exceptions: If True, failed requests yield their exception
+                in place of a response instead of cancelling the batch
+            
+        Returns:
+            ChatResponse objects (or exceptions) in the order of messages_list
+        """
+        semaphore = asyncio.Semaphore(max_at_once)
+        limiter = RateLimiter(max_per_second) if max_per_second else None
+        
+        async def run(messages: List[Dict[str, Any]]) -> ChatResponse:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                return await self.achat(messages, enable_reasoning)
+        
+        return await asyncio.gather(
+            *(run(messages) for messages in messages_list),
+            return_exceptions=return_exceptions
+        )
+    
+    async def _aexecute_stream_request(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Execute Bedrock ConverseStream API call over native async HTTP.
+        
+        Decodes the AWS event-stream framing into the same
+        {event_type: payload} dicts boto3 yields, so _parse_stream_response
+        handles both paths.
+        
+        Args:
+            request: Bedrock ConverseStream API request
+            
+        Yields:
+            Bedrock ConverseStream API response chunks
+            
+        Raises:
+            ProviderError: If streaming API call fails
+        """
+        if self._bedrock_client is not None:
+            async for event in super()._aexecute_stream_request(request):
+                yield event
+            return
+        
+        url, body, headers = self._signed_request(
+            'converse-stream', request, 'application/vnd.amazon.eventstream'
+        )
+        try:
+            async with self.async_client.stream('POST', url, content=body, headers=headers) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise self._http_error(response, streaming=True)
+                
+                from botocore.eventstream import EventStreamBuffer
+                
+                event_buffer = EventStreamBuffer()
+                state = _BedrockStreamState()
+                coalescer = self._stream_coalescer()
+                async for data in response.aiter_bytes():
+                    event_buffer.add_data(data)
+                    for message in event_buffer:
+                        message_headers = message.headers
+                        
+                        # Anything but an 'event' frame ('exception', 'error')
+                        # is a failure, matching botocore's parser
+                        if message_headers.get(':message-type') != 'event':
+                            raise _event_stream_error(message_headers, message.payload)
+                        
+                        payload = orjson.loads(message.payload) if message.payload else {}
+                        event = state.annotate({message_headers.get(':event-type'): payload})
+                        if coalescer is None:
+                            yield event
+                        else:
+                            for ready in coalescer.push(event):
+                                yield ready
+                
+                if coalescer is not None:
+                    for ready in coalescer.flush():
+                        yield ready
+        except httpx.HTTPError as e:
+            raise ProviderError(f"Unexpected error calling Bedrock stream: {str(e)}", provider="bedrock")
     
-
     def _standardize_tool_calls(self, raw_tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Standardize Bedrock tool calls to OpenAI-compatible format.
         
@@ -142,10 +671,9 @@ class Bedrock(BaseProvider):
                     "name": tool_use.get('name'),
                     "arguments": tool_use.get('input', {})
                 }
-                # Convert arguments to JSON string if it's a dict
-                if isinstance(standardized_call["arguments"], dict):
-                    import json
-                    standardized_call["arguments"] = json.dumps(standardized_call["arguments"])
+                # Convert arguments to JSON string unless already encoded
+                if isinstance(standardized_call["arguments"], (dict, list)):
+                    standardized_call["arguments"] = orjson.dumps(standardized_call["arguments"]).decode()
                 
                 standardized.append(standardized_call)
         
@@ -180,8 +708,9 @@ class Bedrock(BaseProvider):
                 system_messages.append({"text": content})
                 continue
             
-            # Convert message content to Bedrock format
-            bedrock_content = self._convert_content_to_bedrock(content)
+            # Convert message content to Bedrock format; plain text (the common case)
+            # is wrapped inline. A fresh list each time: tool calls/reasoning are appended to it.
+            bedrock_content = [{"text": content}] if type(content) is str else self._convert_content_to_bedrock(content)
             
             bedrock_message = {
                 "role": role,  # "user" or "assistant"
@@ -192,12 +721,14 @@ class Bedrock(BaseProvider):
             if role == "assistant" and "tool_calls" in message:
                 # Add tool use content blocks for each tool call
                 for tool_call in message["tool_calls"]:
-                    import json
+                    arguments = tool_call["arguments"]
+                    if isinstance(arguments, str):
+                        arguments = orjson.loads(arguments)
                     tool_content = {
                         "toolUse": {
                             "toolUseId": tool_call["id"],
                             "name": tool_call["name"],
-                            "input": json.loads(tool_call["arguments"]) if isinstance(tool_call["arguments"], str) else tool_call["arguments"]
+                            "input": arguments
                         }
                     }
                     bedrock_message["content"].append(tool_content)
@@ -241,49 +772,51 @@ class Bedrock(BaseProvider):
         if system_messages:
             request["system"] = system_messages
         
-        # Add inference configuration from stored parameters
-        inference_config = {}
+        # Inference, tool and model-specific configuration (precomputed)
+        request.update(self._static_fields)
         
-        # Map common parameters to Bedrock inference config
-        if hasattr(self, 'config'):
-            if 'temperature' in self.config:
-                inference_config['temperature'] = self.config['temperature']
-            if 'max_tokens' in self.config:
-                inference_config['maxTokens'] = self.config['max_tokens']
-            if 'top_p' in self.config:
-                inference_config['topP'] = self.config['top_p']
-            if 'stop_sequences' in self.config:
-                inference_config['stopSequences'] = self.config['stop_sequences']
+        return request
+    
+    def _build_static_fields(self) -> Dict[str, Any]:
+        """Build the request fields that depend only on config and tools.
         
+        Returns:
+            Dictionary with inferenceConfig, toolConfig and
+            additionalModelRequestFields (each only when non-empty)
+        """
+        static_fields = {}
+        
+        # Map common parameters to Bedrock inference config
+        inference_config = {
+            bedrock_key: self.config[key]
+            for key, bedrock_key in self.INFERENCE_CONFIG_KEYS.items()
+            if key in self.config
+        }
         if inference_config:
-            request["inferenceConfig"] = inference_config
+            static_fields["inferenceConfig"] = inference_config
         
         # Add tools if available
         if self.tools:
-            tool_config = self._construct_tools(self.tools)
-            request["toolConfig"] = tool_config
-        
-        # Add additional model-specific parameters (NOT for reasoning - that goes in content)
-        additional_fields = {}
-        if hasattr(self, 'config'):
-            # Add model-specific parameters like top_k for Anthropic models
-            if 'top_k' in self.config:
-                additional_fields['top_k'] = self.config['top_k']
-            # Add any other model-specific parameters
-            for key, value in self.config.items():
-                if key not in ['temperature', 'max_tokens', 'top_p', 'stop_sequences'] and not key.startswith('_'):
-                    additional_fields[key] = value
+            static_fields["toolConfig"] = self._construct_tools(self.tools)
         
+        # Add additional model-specific parameters (NOT for reasoning - that goes in content),
+        # e.g. top_k for Anthropic models
+        additional_fields = {
+            key: value for key, value in self.config.items()
+            if key not in self.INFERENCE_CONFIG_KEYS and not key.startswith('_')
+        }
         if additional_fields:
-            request["additionalModelRequestFields"] = additional_fields
-        
-
+            static_fields["additionalModelRequestFields"] = additional_fields
         
-        return request
+        return static_fields
     
     def _convert_content_to_bedrock(self, content) -> List[Dict[str, Any]]:
         """Convert unified content format to Bedrock content format.
         
+        Media blocks may carry raw bytes (image_bytes, document_bytes,
+        video_bytes), which are preferred and passed through untouched, or
+        base64 strings (image_data, document_data, video_data), which are decoded.
+        
         Args:
             content: Content in unified format (string or list of content blocks)
             
@@ -303,9 +836,10 @@ class Bedrock(BaseProvider):
                     bedrock_content.append({"text": block["text"]})
                 
                 elif block["type"] == "image":
-                    # Convert base64 image data to bytes for Bedrock
-                    import base64
-                    image_data = base64.b64decode(block["image_data"])
+                    # Raw bytes are sent as-is; base64 image data is decoded for Bedrock
+                    image_data = block.get("image_bytes")
+                    if image_data is None:
+                        image_data = base64.b64decode(block["image_data"])
                     
                     # Determine image format (default to jpeg)
                     image_format = block.get("format", "jpeg")
@@ -321,8 +855,9 @@ class Bedrock(BaseProvider):
                 
                 elif block["type"] == "document":
                     # Convert document content
-                    import base64
-                    document_data = base64.b64decode(block["document_data"])
+                    document_data = block.get("document_bytes")
+                    if document_data is None:
+                        document_data = base64.b64decode(block["document_data"])
                     
                     bedrock_content.append({
                         "document": {
@@ -336,8 +871,9 @@ class Bedrock(BaseProvider):
                 
                 elif block["type"] == "video":
                     # Convert video content
-                    import base64
-                    video_data = base64.b64decode(block["video_data"])
+                    video_data = block.get("video_bytes")
+                    if video_data is None:
+                        video_data = base64.b64decode(block["video_data"])
                     
                     bedrock_content.append({
                         "video": {
@@ -369,7 +905,12 @@ class Bedrock(BaseProvider):
             response = self.client.converse(**request)
             return response
             
-        except ClientError as e:
+        except Exception as e:
+            from botocore.exceptions import ClientError
+            
+            if not isinstance(e, ClientError):
+                raise ProviderError(f"Unexpected error calling Bedrock: {str(e)}", provider="bedrock")
+            
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_message = e.response.get('Error', {}).get('Message', str(e))
             
@@ -378,8 +919,12 @@ class Bedrock(BaseProvider):
                 provider="bedrock",
                 status_code=e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
             )
-        except Exception as e:
-            raise ProviderError(f"Unexpected error calling Bedrock: {str(e)}", provider="bedrock")
+    
+    def _stream_coalescer(self) -> Optional[_StreamCoalescer]:
+        """Create a per-stream delta coalescer, or None when merging is off."""
+        if self.stream_buffer_size > 1:
+            return _StreamCoalescer(self.stream_buffer_size, self.stream_coalesce_ms)
+        return None
     
     def _execute_stream_request(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """Execute Bedrock ConverseStream API call.
@@ -397,10 +942,24 @@ class Bedrock(BaseProvider):
             response = self.client.converse_stream(**request)
             
             # Process the event stream
+            state = _BedrockStreamState()
+            coalescer = self._stream_coalescer()
             for event in response.get('stream', []):
-                yield event
+                event = state.annotate(event)
+                if coalescer is None:
+                    yield event
+                else:
+                    yield from coalescer.push(event)
+            
+            if coalescer is not None:
+                yield from coalescer.flush()
                 
-        except ClientError as e:
+        except Exception as e:
+            from botocore.exceptions import ClientError
+            
+            if not isinstance(e, ClientError):
+                raise ProviderError(f"Unexpected error calling Bedrock stream: {str(e)}", provider="bedrock")
+            
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_message = e.response.get('Error', {}).get('Message', str(e))
             
@@ -409,8 +968,6 @@ class Bedrock(BaseProvider):
                 provider="bedrock",
                 status_code=e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
             )
-        except Exception as e:
-            raise ProviderError(f"Unexpected error calling Bedrock stream: {str(e)}", provider="bedrock")
     
     def _parse_response(
         self, 
@@ -426,20 +983,10 @@ class Bedrock(BaseProvider):
         Returns:
             ChatResponse in unified format
         """
-        # Extract the main output message
-        output = response.get("output", {})
-        message = output.get("message", {})
-        
-        # Extract content and reasoning
-        final_content, reasoning_content = self._extract_reasoning_content(response)
-        
-        # Extract tool calls and standardize them
-        raw_tool_calls = []
-        content_blocks = message.get("content", [])
-        
-        for block in content_blocks:
-            if "toolUse" in block:
-                raw_tool_calls.append(block)
+        # Extract content, reasoning and tool calls in one pass over the content blocks
+        text_parts, reasoning_parts, raw_tool_calls = self._split_content_blocks(response)
+        final_content = "\n".join(text_parts) if text_parts else ""
+        reasoning_content = "\n".join(reasoning_parts) if reasoning_parts else None
         
         standardized_tool_calls = self._standardize_tool_calls(raw_tool_calls)
         
@@ -483,76 +1030,86 @@ class Bedrock(BaseProvider):
         Returns:
             ChatStreamResponse in unified format
         """
-        # Initialize default values
-        content_delta = None
-        reasoning_delta = None
-        tool_call_delta = None
-        is_finished = False
-        finish_reason = None
-        metadata = {}
+        # Each chunk is a single-key dict: {event_type: payload}
+        event_type = next(iter(chunk), None)
+        handler = self._STREAM_HANDLERS.get(event_type)
+        if handler is None:
+            # contentBlockStart and unknown events carry no delta
+            return ChatStreamResponse(delta="")
+        return handler(self, chunk[event_type], enable_reasoning)
+    
+    def _stream_message_start(self, event: Dict[str, Any], enable_reasoning: bool) -> ChatStreamResponse:
+        """Handle messageStart: start of message, no delta content."""
+        return ChatStreamResponse(delta="", metadata={'role': event.get('role')})
+    
+    def _stream_content_block_delta(self, event: Dict[str, Any], enable_reasoning: bool) -> ChatStreamResponse:
+        """Handle contentBlockDelta: text, tool use, or reasoning content."""
+        get = event.get('delta', _EMPTY).get
         
-        # Process different event types according to AWS documentation
-        if 'messageStart' in chunk:
-            # Start of message - no delta content
-            metadata['role'] = chunk['messageStart'].get('role')
-            
-        elif 'contentBlockDelta' in chunk:
-            # Content delta - extract text, tool use, or reasoning content
-            delta = chunk['contentBlockDelta'].get('delta', {})
-            
-            if 'text' in delta:
-                content_delta = delta['text']
-                
-            elif 'toolUse' in delta:
-                # Tool use delta
-                tool_call_delta = {
-                    'id': chunk['contentBlockStart'].get('start', {}).get('toolUse', {}).get('toolUseId'),
-                    'name': chunk['contentBlockStart'].get('start', {}).get('toolUse', {}).get('name'),
-                    'arguments_delta': delta['toolUse'].get('input', '')
-                }
-                
-            elif 'reasoningContent' in delta:
-                # Reasoning content delta (Claude 3.7+ models)
-                reasoning_delta = delta['reasoningContent'].get('text', '')
-                
-        elif 'contentBlockStop' in chunk:
-            # End of content block - no delta content
-            pass
-            
-        elif 'messageStop' in chunk:
-            # End of message
-            is_finished = True
-            finish_reason = chunk['messageStop'].get('stopReason')
-            
-        elif 'metadata' in chunk:
-            # Final metadata with usage and metrics
-            usage = chunk['metadata'].get('usage', {})
-            metrics = chunk['metadata'].get('metrics', {})
-            
-            metadata.update({
-                'usage': usage,
-                'metrics': metrics,
-                'model': self.model_id,
-                'provider': 'bedrock'
-            })
+        text = get('text')
+        if text is not None:
+            return ChatStreamResponse(delta=text)
+        
+        tool_use = get('toolUse')
+        if tool_use is not None:
+            # id/name are filled in from contentBlockStart by _BedrockStreamState
+            tool_call_delta = {
+                'id': tool_use.get('toolUseId'),
+                'name': tool_use.get('name'),
+                'arguments_delta': tool_use.get('input', '')
+            }
+            return ChatStreamResponse(delta="", tool_calls=[tool_call_delta])
         
-        # Convert to the correct ChatStreamResponse format
-        delta = content_delta if content_delta else ""
-        is_complete = is_finished
-        tool_calls = [tool_call_delta] if tool_call_delta else None
+        reasoning = get('reasoningContent')
+        if reasoning is not None:
+            # Reasoning content delta (Claude 3.7+ models)
+            return ChatStreamResponse(delta="", reasoning_delta=reasoning.get('text', ''))
         
+        return ChatStreamResponse(delta="")
+    
+    def _stream_content_block_stop(self, event: Dict[str, Any], enable_reasoning: bool) -> ChatStreamResponse:
+        """Handle contentBlockStop: emit the complete tool call when a tool-use block ends."""
+        tool_use = event.get('toolUse')
+        if tool_use is None:
+            return ChatStreamResponse(delta="")
+        
+        # Assembled by _BedrockStreamState; arguments is the full JSON string
+        tool_call = {
+            'id': tool_use['toolUseId'],
+            'name': tool_use['name'],
+            'arguments': tool_use['input']
+        }
+        return ChatStreamResponse(delta="", tool_calls=[tool_call])
+    
+    def _stream_message_stop(self, event: Dict[str, Any], enable_reasoning: bool) -> ChatStreamResponse:
+        """Handle messageStop: end of message."""
+        metadata = {}
+        finish_reason = event.get('stopReason')
         if finish_reason:
             metadata['finish_reason'] = finish_reason
-        
+        return ChatStreamResponse(delta="", is_complete=True, metadata=metadata)
+    
+    def _stream_metadata(self, event: Dict[str, Any], enable_reasoning: bool) -> ChatStreamResponse:
+        """Handle metadata: final usage and metrics."""
         return ChatStreamResponse(
-            delta=delta,
-            reasoning_delta=reasoning_delta,
-            is_reasoning_complete=False,  # Set based on contentBlockStop for reasoning
-            is_complete=is_complete,
-            tool_calls=tool_calls,
-            metadata=metadata
+            delta="",
+            metadata={
+                'usage': event.get('usage', {}),
+                'metrics': event.get('metrics', {}),
+                'model': self.model_id,
+                'provider': 'bedrock'
+            }
         )
     
+    # Stream event type -> handler; one dict lookup per event instead of an if/elif chain
+    _STREAM_HANDLERS = {
+        'messageStart': _stream_message_start,
+        'contentBlockDelta': _stream_content_block_delta,
+        'contentBlockStop': _stream_content_block_stop,
+        'messageStop': _stream_message_stop,
+        'metadata': _stream_metadata,
+    }
+    
     def _construct_tools(self, functions: List[Callable]) -> Dict[str, Any]:
         """Convert functions to Bedrock tool configuration format.
         
@@ -588,34 +1145,53 @@ class Bedrock(BaseProvider):
             "toolChoice": {"auto": {}}  # Default to auto tool choice
         }
     
-    def _extract_reasoning_content(self, response: Dict[str, Any]) -> Tuple[str, Optional[str]]:
-        """Extract content and reasoning from Bedrock response.
+    def _split_content_blocks(
+        self, response: Dict[str, Any]
+    ) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+        """Sort the response's content blocks into text, reasoning and tool use.
         
         Args:
             response: Bedrock Converse API response
             
         Returns:
-            Tuple of (final_content, reasoning_content)
+            Tuple of (text_parts, reasoning_parts, raw_tool_calls)
         """
-        output = response.get("output", {})
-        message = output.get("message", {})
-        content_blocks = message.get("content", [])
+        content_blocks = response.get("output", {}).get("message", {}).get("content", [])
         
-        final_content_parts = []
-        reasoning_content_parts = []
+        text_parts = []
+        reasoning_parts = []
+        raw_tool_calls = []
         
         for block in content_blocks:
-            # Handle text content
-            if "text" in block:
-                final_content_parts.append(block["text"])
+            # Content blocks are unions: exactly one key names the block type
+            block_type = next(iter(block), None)
+            
+            if block_type == "text":
+                text_parts.append(block["text"])
             
             # Handle reasoning content (Claude 3.7+ models)
-            elif "reasoningContent" in block:
+            elif block_type == "reasoningContent":
                 reasoning_text = block["reasoningContent"].get("reasoningText", {})
-                reasoning_content_parts.append(reasoning_text.get("text", ""))
+                reasoning_parts.append(reasoning_text.get("text", ""))
+            
+            elif block_type == "toolUse":
+                raw_tool_calls.append(block)
+        
+        return text_parts, reasoning_parts, raw_tool_calls
+    
+    def _extract_reasoning_content(self, response: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Extract content and reasoning from Bedrock response.
+        
+        Args:
+            response: Bedrock Converse API response
+            
+        Returns:
+            Tuple of (final_content, reasoning_content)
+        """
+        final_content_parts, reasoning_content_parts, _ = self._split_content_blocks(response)
         
         # Combine content parts
         final_content = "\n".join(final_content_parts) if final_content_parts else ""
         reasoning_content = "\n".join(reasoning_content_parts) if reasoning_content_parts else None
         
-        return final_content, reasoning_content 
\ No newline at end of file
+        return final_content, reasoning_content
@@ -1,15 +1,292 @@
 """OpenAI-compatible provider for unified LLM interface."""
 
 import os
-import json
+import atexit
+import asyncio
+import base64
+import time
 import uuid
 import re
-from typing import Dict, List, Any, Iterator, Optional, Callable, Tuple
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, AsyncIterator, Iterator, Optional, Callable, Tuple, Union
 import httpx
+import orjson
 from ...base import BaseProvider
 from ...models import ChatResponse, ChatStreamResponse
 from ...exceptions import ProviderError, ConfigurationError
-from ...utils import extract_function_schema
+from ...cache import SemanticCache
+from ...utils import RateLimiter, extract_function_schema, validate_messages, retry_delay
+
+_log = logging.getLogger(__name__)
+
+
+class _SSEParser:
+    """Incremental splitter for a raw SSE byte stream.
+    
+    Works on bytes end to end so payloads can go straight to orjson without
+    a per-line UTF-8 decode. Shared by the sync and async stream paths.
+    """
+    
+    __slots__ = ('_buffer', 'done')
+    
+    def __init__(self):
+        self._buffer = bytearray()
+        self.done = False
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add a body chunk and return the complete 'data:' payloads in it.
+        
+        Sets done (and stops returning payloads) at '[DONE]'.
+        """
+        payloads = []
+        buffer = self._buffer
+        buffer += chunk
+        start = 0
+        while (newline := buffer.find(b'\n', start)) != -1:
+            data = self._data_field(buffer[start:newline])
+            start = newline + 1
+            if data is not None:
+                if data == b'[DONE]':
+                    self.done = True
+                    break
+                payloads.append(data)
+        del buffer[:start]
+        return payloads
+    
+    def flush(self) -> List[bytes]:
+        """Return the last payload if it arrived without a trailing newline."""
+        if not self.done:
+            data = self._data_field(self._buffer)
+            if data is not None and data != b'[DONE]':
+                return [data]
+        return []
+    
+    @staticmethod
+    def _data_field(line: bytes) -> Optional[bytes]:
+        """Return the value of a 'data:' line (CR and one leading space removed), else None."""
+        if not line.startswith(b'data:'):
+            return None
+        data = line[5:].rstrip(b'\r')
+        return data[1:] if data.startswith(b' ') else data
+
+
+def _iter_sse_data(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Split a raw SSE byte stream into 'data:' payloads.
+    
+    Args:
+        chunks: Raw response body chunks
+        
+    Yields:
+        Payload of each 'data:' line, stopping at '[DONE]'
+    """
+    parser = _SSEParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.flush()
+
+
+# Common reasoning tags. One alternation finds the first tagged block (or,
+# while streaming, any opening/closing tag) in a single scan; the per-tag
+# patterns then strip every block of the tag that matched.
+_REASONING_TAGS = ('think', 'thinking', 'reasoning', 'analysis')
+_REASONING_BLOCK = re.compile(r'<(think|thinking|reasoning|analysis)>(.*?)</\1>', re.DOTALL)
+_REASONING_TAG = re.compile(r'<(/?)(?:think|thinking|reasoning|analysis)>')
+_REASONING_PATTERNS = {
+    tag: re.compile(rf'<{tag}>(.*?)</{tag}>', re.DOTALL) for tag in _REASONING_TAGS
+}
+
+
+class _ReasoningTagState:
+    """Per-stream flag for tagged reasoning that spans several deltas.
+    
+    Created by chat_stream/achat_stream for each stream, so concurrent
+    streams on one provider do not route each other's content.
+    """
+    
+    __slots__ = ('in_reasoning',)
+    
+    def __init__(self):
+        self.in_reasoning = False
+
+# Transport errors raised before the request reached the server; only these
+# are safe to retry for non-idempotent completions
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Connection pool sizing shared by the sync and async clients. HTTP/2 is
+# negotiated over TLS, so concurrent streams to HTTPS endpoints multiplex
+# over one connection; plain-HTTP local servers keep using HTTP/1.1.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=60.0)
+
+# Process-wide client pool: providers for the same endpoint and credentials
+# share one connection pool. Entries are [client, refcount].
+_CLIENT_POOL: Dict[Tuple[str, str, str], List[Any]] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _acquire_client(base_url: str, api_key: str, timeout: Any) -> Tuple[Tuple[str, str, str], httpx.Client]:
+    """Get (or create) the shared client for an endpoint and take a reference.
+    
+    Args:
+        base_url: Normalized API base URL
+        api_key: API key sent as bearer token
+        timeout: httpx timeout configuration
+        
+    Returns:
+        Tuple of (pool key, shared httpx client)
+    """
+    # Digest the key so the pool index does not hold the raw credential
+    key = (base_url, hashlib.blake2b(api_key.encode()).hexdigest()[:16], repr(timeout))
+    with _CLIENT_POOL_LOCK:
+        entry = _CLIENT_POOL.get(key)
+        if entry is None:
+            client = httpx.Client(
+                headers={
+                    'Content-Type': 'application/json',
+                    'Authorization': f'Bearer {api_key}'
+                },
+                timeout=timeout,
+                limits=_HTTP_LIMITS,
+                http2=True
+            )
+            entry = _CLIENT_POOL[key] = [client, 0]
+        entry[1] += 1
+        return key, entry[0]
+
+
+def _release_client(key: Tuple[str, str, str]) -> None:
+    """Drop a reference to a shared client, closing it when unused."""
+    with _CLIENT_POOL_LOCK:
+        entry = _CLIENT_POOL.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _CLIENT_POOL[key]
+    entry[0].close()
+
+
+@atexit.register
+def _close_client_pool() -> None:
+    """Close all pooled clients at interpreter exit."""
+    with _CLIENT_POOL_LOCK:
+        clients = [entry[0] for entry in _CLIENT_POOL.values()]
+        _CLIENT_POOL.clear()
+    for client in clients:
+        client.close()
+
+
+def _convert_text_part(part: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a unified text block to OpenAI format."""
+    return {
+        'type': 'text',
+        'text': part['text']
+    }
+
+
+# Leading bytes of common image formats -> image format. WebP is checked
+# separately: RIFF also wraps WAV and AVI, so it needs the WEBP fourcc.
+_IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'\x89PNG', 'png'),
+    (b'GIF8', 'gif'),
+)
+
+# Data URL prefixes per format, built once rather than formatted per image
+_DATA_URL_PREFIXES = {
+    image_format: f"data:image/{image_format};base64,"
+    for image_format in ('jpeg', 'png', 'gif', 'webp')
+}
+
+
+def _sniff_image_format(image_data: Union[str, bytes]) -> str:
+    """Guess the image format from the payload's leading bytes.
+    
+    Args:
+        image_data: Base64 string or raw image bytes
+        
+    Returns:
+        Image format name (jpeg, png, gif or webp), defaulting to jpeg
+    """
+    if isinstance(image_data, str):
+        # 16 base64 characters decode to the 12 bytes the checks need
+        head = image_data[:16]
+        try:
+            image_data = base64.b64decode(head[:len(head) // 4 * 4])
+        except ValueError:
+            return 'jpeg'
+    
+    for signature, image_format in _IMAGE_SIGNATURES:
+        if image_data.startswith(signature):
+            return image_format
+    if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        return 'webp'
+    return 'jpeg'
+
+
+def _image_data_url(image_data: str, image_format: Optional[str] = None) -> str:
+    """Build the data URL for base64 image data.
+    
+    Only the format is sniffed from the leading characters; the payload is
+    concatenated once and not cached, so large images are not kept alive.
+    Data that is already a data URL is passed through untouched.
+    """
+    if image_data.startswith('data:'):
+        return image_data
+    image_format = image_format or _sniff_image_format(image_data)
+    prefix = _DATA_URL_PREFIXES.get(image_format) or f"data:image/{image_format};base64,"
+    return prefix + image_data
+
+
+def _convert_image_part(part: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a unified image block (base64 or raw bytes) to OpenAI image_url format.
+    
+    The media type comes from the block's optional 'format' key (as used by
+    the Bedrock provider) or is detected from the image signature.
+    """
+    image_format = part.get('format')
+    image_bytes = part.get('image_bytes')
+    if image_bytes is not None:
+        image_format = image_format or _sniff_image_format(image_bytes)
+        prefix = _DATA_URL_PREFIXES.get(image_format) or f"data:image/{image_format};base64,"
+        url = prefix + base64.b64encode(image_bytes).decode('ascii')
+    else:
+        url = _image_data_url(part['image_data'], image_format)
+    return {
+        'type': 'image_url',
+        'image_url': {
+            'url': url
+        }
+    }
+
+
+# Content block type -> converter; add new block types here
+_PART_CONVERTERS = {
+    'text': _convert_text_part,
+    'image': _convert_image_part,
+}
+
+
+def _extract_error_detail(response: httpx.Response) -> str:
+    """Pull the API's error message out of a failed response body.
+    
+    Args:
+        response: Fully read HTTP response with a non-200 status
+        
+    Returns:
+        The ``error.message`` field when the body is OpenAI-style JSON,
+        otherwise the raw response text
+    """
+    try:
+        message = orjson.loads(response.content)['error']['message']
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return response.text
+    return message if isinstance(message, str) and message else response.text
 
 
 class OpenAILike(BaseProvider):
@@ -28,6 +305,9 @@ class OpenAILike(BaseProvider):
         'presence_penalty', 'stop', 'seed'
     }
     
+    # Transient statuses worth retrying (timeouts, rate limits, server errors)
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+    
     def __init__(self, model_id: str, tools: Optional[List[Callable]] = None, **kwargs):
         """Initialize OpenAI-compatible provider.
         
@@ -37,51 +317,79 @@ class OpenAILike(BaseProvider):
             **kwargs: All parameters including:
                 Common params: temperature, max_tokens, top_p, frequency_penalty, etc.
                 Provider-specific: top_k, repetition_penalty, min_p, typical_p, etc.
-                Connection: base_url, api_key, timeout
+                Connection: base_url, api_key, timeout, validate_connection
+                    (probe GET /models during construction; off by default)
+                Caching: cache_enabled, cache_size, semantic_cache
+                Retries: max_retries (default 3; 0 disables), backoff_base, backoff_max.
+                    408/429/5xx responses and failures to connect are retried;
+                    errors after the request was sent (e.g. read timeouts) are
+                    not, since the server may already be generating (and
+                    billing) the completion
+                Streaming: include_raw_chunk (keep each decoded chunk in
+                    stream metadata['raw_chunk']; off by default)
         """
         # Extract connection parameters
         self.base_url = kwargs.pop('base_url', os.getenv('OPENAI_LIKE_BASE_URL', 'http://localhost:8000/v1'))
         self.api_key = kwargs.pop('api_key', os.getenv('OPENAI_LIKE_API_KEY', 'dummy-key'))
         self.timeout = kwargs.pop('timeout', 30)
+        validate_connection = kwargs.pop('validate_connection', False)
+        
+        # Extract caching parameters. The exact-match cache only applies to
+        # deterministic (temperature == 0) requests.
+        self.cache_enabled = kwargs.pop('cache_enabled', False)
+        self.cache_size = kwargs.pop('cache_size', 128)
+        self.semantic_cache: Optional[SemanticCache] = kwargs.pop('semantic_cache', None)
+        self._cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
+        # Guards the response cache; chat() may be called from several threads
+        self._cache_lock = threading.Lock()
+        
+        # Extract retry parameters for transient failures
+        self.max_retries = kwargs.pop('max_retries', 3)
+        self.backoff_base = kwargs.pop('backoff_base', 0.5)
+        self.backoff_max = kwargs.pop('backoff_max', 30.0)
+        
+        # Holding on to every decoded chunk keeps it alive as long as the
+        # caller keeps the response, so it is only attached on request
+        self.include_raw_chunk = kwargs.pop('include_raw_chunk', False)
         
-        # Ensure base_url ends with /v1
+        # Ensure base_url ends with /v1 (tolerating a trailing slash)
+        self.base_url = self.base_url.rstrip('/')
         if not self.base_url.endswith('/v1'):
-            if self.base_url.endswith('/'):
-                self.base_url += 'v1'
-            else:
-                self.base_url += '/v1'
+            self.base_url += '/v1'
         
-        # Separate common parameters from provider-specific parameters
-        self.common_params = {}
-        self.provider_params = {}
+        # Endpoint URLs are fixed, so build them once rather than per request
+        self._chat_url = f"{self.base_url}/chat/completions"
+        self._models_url = f"{self.base_url}/models"
         
-        for key, value in kwargs.items():
-            if key in self.COMMON_PARAMS:
-                self.common_params[key] = value
-            else:
-                self.provider_params[key] = value
+        # Separate common parameters from provider-specific parameters
+        self.common_params = {key: kwargs[key] for key in kwargs.keys() & self.COMMON_PARAMS}
+        self.provider_params = {key: value for key, value in kwargs.items() if key not in self.COMMON_PARAMS}
         
         # Set defaults for common parameters if not provided
         self.common_params.setdefault('temperature', 0.7)
         self.common_params.setdefault('max_tokens', 1000)
         
-        # Initialize streaming reasoning state
-        self._in_reasoning_mode = False
-        
         # Call parent constructor with all parameters
         super().__init__(model_id, tools, **kwargs)
         
-        # Initialize httpx client
-        self.client = httpx.Client(
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}'
-            },
-            timeout=self.timeout
-        )
+        # Build the request skeleton (model, params, tools, tool_choice) once;
+        # it is only rebuilt if common_params or provider_params are edited
+        self._tools_payload = self._construct_tools(self.tools) if self.tools else None
+        self._update_base_request()
+        
+        # Share an httpx client (and its connections) with other instances
+        # pointing at the same endpoint
+        self._client_key, self.client = _acquire_client(self.base_url, self.api_key, self.timeout)
+        
+        # Async client is created on first async call, and again whenever the
+        # running event loop changes (its connections belong to one loop)
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
         
-        # Test connection
-        self._test_connection()
+        # Probing the endpoint costs a full round trip per instance, so only do
+        # it on request; otherwise the first real call surfaces connection errors
+        if validate_connection:
+            self._test_connection()
     
     def __enter__(self):
         """Context manager entry."""
@@ -91,15 +399,59 @@ class OpenAILike(BaseProvider):
         """Context manager exit - cleanup resources."""
         self.close()
     
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - cleanup resources."""
+        await self.aclose()
+    
     def close(self):
-        """Close the HTTP client."""
-        if hasattr(self, 'client'):
-            self.client.close()
+        """Release the shared HTTP client; it is closed once no provider uses it."""
+        if getattr(self, '_client_key', None) is not None:
+            _release_client(self._client_key)
+            self._client_key = None
+    
+    async def aclose(self):
+        """Close the async HTTP client and release the shared sync client."""
+        client, self._async_client = self._async_client, None
+        loop, self._async_client_loop = self._async_client_loop, None
+        # A client opened on another loop can't be closed from this one; its
+        # connections are dropped with it
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+        self.close()
+    
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Get the httpx client for the running event loop, creating it if needed.
+        
+        httpx.AsyncClient connections are bound to the loop they were opened
+        on, so each asyncio.run() (or other loop) gets a client of its own.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = self._new_async_client()
+            self._async_client_loop = loop
+        return self._async_client
+    
+    def _new_async_client(self) -> httpx.AsyncClient:
+        """Build an httpx client for the async API."""
+        return httpx.AsyncClient(
+            headers={
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {self.api_key}'
+            },
+            timeout=self.timeout,
+            limits=_HTTP_LIMITS,
+            http2=True
+        )
     
     def _test_connection(self) -> None:
         """Test connection to the API endpoint."""
         try:
-            response = self.client.get(f"{self.base_url}/models")
+            response = self.client.get(self._models_url)
             if response.status_code != 200:
                 raise ProviderError(
                     f"Failed to connect to OpenAI-like endpoint: {response.status_code}",
@@ -109,6 +461,299 @@ class OpenAILike(BaseProvider):
         except httpx.RequestError as e:
             raise ConfigurationError(f"Cannot connect to OpenAI-like endpoint at {self.base_url}: {e}")
     
+    def chat(self, messages: List[Dict[str, Any]], enable_reasoning: bool = False, cache: bool = True) -> ChatResponse:
+        """Synchronous chat completion with optional reasoning and response caching.
+        
+        Args:
+            messages: List of message dictionaries in OpenAI-compatible format
+            enable_reasoning: Whether to enable reasoning content extraction
+            cache: Set to False to bypass the exact-match and semantic caches
+                   for this call
+            
+        Returns:
+            ChatResponse containing the completion result with tool_calls as data
+            
+        Raises:
+            ValidationError: If messages format is invalid
+            ProviderError: If provider API call fails
+        """
+        validate_messages(messages)
+        
+        request = self._prepare_request(messages, enable_reasoning=enable_reasoning)
+        
+        if not cache:
+            response = self._execute_request(request)
+        else:
+            response, key = self._cache_lookup(request, messages)
+            if response is None:
+                response = self._execute_request(request)
+                self._cache_store(key, messages, response)
+        
+        return self._parse_response(response, enable_reasoning=enable_reasoning)
+    
+    async def achat(self, messages: List[Dict[str, Any]], enable_reasoning: bool = False, cache: bool = True) -> ChatResponse:
+        """Asynchronous chat completion with optional reasoning and response caching.
+        
+        Same contract as chat(); many calls can be awaited concurrently
+        (e.g. with asyncio.gather) over one async connection pool.
+        
+        Args:
+            messages: List of message dictionaries in OpenAI-compatible format
+            enable_reasoning: Whether to enable reasoning content extraction
+            cache: Set to False to bypass the exact-match and semantic caches
+                   for this call
+            
+        Returns:
+            ChatResponse containing the completion result with tool_calls as data
+            
+        Raises:
+            ValidationError: If messages format is invalid
+            ProviderError: If provider API call fails
+        """
+        validate_messages(messages)
+        
+        request = self._prepare_request(messages, enable_reasoning=enable_reasoning)
+        
+        if not cache:
+            response = await self._aexecute_request(request)
+        else:
+            response, key = self._cache_lookup(request, messages)
+            if response is None:
+                response = await self._aexecute_request(request)
+                self._cache_store(key, messages, response)
+        
+        return self._parse_response(response, enable_reasoning=enable_reasoning)
+    
+    def chat_stream(self, messages: List[Dict[str, Any]], enable_reasoning: bool = False) -> Iterator[ChatStreamResponse]:
+        """Streaming chat completion with optional reasoning.
+        
+        Args:
+            messages: List of message dictionaries in OpenAI-compatible format
+            enable_reasoning: Whether to enable reasoning content extraction
+            
+        Yields:
+            ChatStreamResponse chunks with tool_calls as data
+            
+        Raises:
+            ValidationError: If messages format is invalid
+            ProviderError: If provider API call fails
+        """
+        validate_messages(messages)
+        
+        request = self._prepare_request(messages, stream=True, enable_reasoning=enable_reasoning)
+        
+        state = _ReasoningTagState()
+        for chunk in self._execute_stream_request(request):
+            yield self._parse_stream_response(chunk, enable_reasoning, state)
+    
+    async def achat_stream(self, messages: List[Dict[str, Any]], enable_reasoning: bool = False) -> AsyncIterator[ChatStreamResponse]:
+        """Asynchronous streaming chat completion with optional reasoning.
+        
+        Args:
+            messages: List of message dictionaries in OpenAI-compatible format
+            enable_reasoning: Whether to enable reasoning content extraction
+            
+        Yields:
+            ChatStreamResponse chunks with tool_calls as data
+            
+        Raises:
+            ValidationError: If messages format is invalid
+            ProviderError: If provider API call fails
+        """
+        validate_messages(messages)
+        
+        request = self._prepare_request(messages, stream=True, enable_reasoning=enable_reasoning)
+        
+        state = _ReasoningTagState()
+        async for chunk in self._aexecute_stream_request(request):
+            yield self._parse_stream_response(chunk, enable_reasoning, state)
+    
+    def _cache_lookup(
+        self, request: Dict[str, Any], messages: List[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """Look a request up in the semantic and exact-match caches.
+        
+        Args:
+            request: OpenAI-compatible request
+            messages: Original messages, used as the semantic cache key
+            
+        Returns:
+            Tuple of (cached response or None, exact-match key to store under
+            or None when the request is not cacheable)
+        """
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.lookup(messages)
+            if cached is not None:
+                return cached, None
+        
+        key = None
+        if self.cache_enabled and request.get('temperature') == 0:
+            key = hashlib.blake2b(self._canonical(request)).digest()
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    return cached, key
+        
+        return None, key
+    
+    def _cache_store(self, key: Optional[bytes], messages: List[Dict[str, Any]], response: Dict[str, Any]) -> None:
+        """Store a fresh response in the caches after a lookup miss.
+        
+        Args:
+            key: Exact-match key from _cache_lookup (None if not cacheable)
+            messages: Original messages, used as the semantic cache key
+            response: OpenAI-compatible response
+        """
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = response
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        
+        if self.semantic_cache is not None:
+            self.semantic_cache.store(messages, response)
+    
+    async def achat_batch(
+        self,
+        batch: List[List[Dict[str, Any]]],
+        max_concurrency: int = 50,
+        return_exceptions: bool = True,
+        enable_reasoning: bool = False,
+        show_progress: bool = False,
+        output_jsonl: Optional[str] = None,
+        rate_limit_qpm: Optional[float] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Union[ChatResponse, BaseException]]:
+        """Run many independent chat completions concurrently.
+        
+        Overlapping the requests collapses wall time from the sum of the
+        latencies to roughly the slowest one.
+        
+        Args:
+            batch: List of conversations, each a list of message dictionaries
+            max_concurrency: Maximum number of requests in flight at once
+            return_exceptions: Return failures in place instead of raising the first one
+            enable_reasoning: Whether to enable reasoning content extraction
+            show_progress: Display a progress bar (requires tqdm)
+            output_jsonl: Optional checkpoint file. Each completed item is appended
+                          as it finishes; rerunning with the same file skips items
+                          already recorded, so interrupted runs resume where they stopped.
+            rate_limit_qpm: Optional cap on requests started per minute, to stay
+                            under the endpoint's rate limit
+            on_progress: Optional callback invoked as on_progress(done, total)
+                         after each item completes
+            
+        Returns:
+            Results in the same order as batch (ChatResponse or exception)
+            
+        Raises:
+            ConfigurationError: If show_progress is set and tqdm is not installed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = RateLimiter(rate_limit_qpm, per=60.0) if rate_limit_qpm else None
+        completed = self._load_batch_checkpoint(output_jsonl) if output_jsonl else {}
+        done_count = len(completed)
+        
+        progress = None
+        if show_progress:
+            try:
+                from tqdm.asyncio import tqdm
+            except ImportError:
+                raise ConfigurationError("show_progress=True requires the 'tqdm' package")
+            progress = tqdm(total=len(batch), initial=len(completed))
+        
+        checkpoint = None
+        if output_jsonl:
+            checkpoint = open(output_jsonl, 'ab')
+            # Terminate a line left half-written by an interrupted run, so the
+            # next record does not get glued onto it
+            if checkpoint.tell() and not self._ends_with_newline(output_jsonl):
+                checkpoint.write(b'\n')
+        
+        async def _one(index: int, messages: List[Dict[str, Any]]) -> ChatResponse:
+            nonlocal done_count
+            if index in completed:
+                return completed[index]
+            
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                response = await self.achat(messages, enable_reasoning)
+            
+            if checkpoint is not None:
+                checkpoint.write(orjson.dumps({'index': index, 'response': response.model_dump()}) + b'\n')
+                checkpoint.flush()
+            if progress is not None:
+                progress.update(1)
+            done_count += 1
+            if on_progress is not None:
+                on_progress(done_count, len(batch))
+            return response
+        
+        try:
+            return await asyncio.gather(
+                *(_one(index, messages) for index, messages in enumerate(batch)),
+                return_exceptions=return_exceptions
+            )
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+            if progress is not None:
+                progress.close()
+    
+    @staticmethod
+    def _load_batch_checkpoint(path: str) -> Dict[int, ChatResponse]:
+        """Load completed batch items from a JSONL checkpoint file.
+        
+        Args:
+            path: Checkpoint file written by achat_batch
+            
+        Returns:
+            Mapping of batch index to its recorded ChatResponse
+        """
+        if not os.path.exists(path):
+            return {}
+        
+        completed = {}
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Partially written line from an interrupted run
+                    continue
+                completed[record['index']] = ChatResponse.model_validate(record['response'])
+        return completed
+    
+    @staticmethod
+    def _ends_with_newline(path: str) -> bool:
+        """Return whether a non-empty file ends with a newline."""
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+    
+    @staticmethod
+    def _canonical(request: Dict[str, Any]) -> bytes:
+        """Serialize a request deterministically for cache keys and tracing.
+        
+        Keys are sorted at every level so equal requests always produce the
+        same bytes regardless of dict insertion order. The wire payload keeps
+        unsorted serialization, which is slightly faster.
+        
+        Args:
+            request: OpenAI-compatible request
+            
+        Returns:
+            Canonical JSON bytes
+        """
+        return orjson.dumps(request, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    
+    def clear_cache(self) -> None:
+        """Drop all entries from the exact-match response cache."""
+        with self._cache_lock:
+            self._cache.clear()
+    
     def _standardize_tool_calls(self, raw_tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Standardize OpenAI tool calls to consistent format.
         
@@ -157,6 +802,48 @@ class OpenAILike(BaseProvider):
         
         return standardized
     
+    def _build_base_request(self) -> Dict[str, Any]:
+        """Build the per-instance request fields shared by every call.
+        
+        Returns:
+            Request dictionary without messages and stream flag
+        """
+        base_request = {
+            'model': self.model_id,
+            **self.common_params,      # Add all common parameters
+            **self.provider_params     # Add all provider-specific parameters
+        }
+        
+        # Add tools if available
+        if self._tools_payload is not None:
+            base_request['tools'] = self._tools_payload
+            base_request['tool_choice'] = 'auto'
+        
+        return base_request
+    
+    def _update_base_request(self) -> None:
+        """Rebuild the request skeleton and its pre-encoded JSON fragment.
+        
+        Stores them with shallow copies of the parameters they were built
+        from, so _prepare_request can tell when common_params or
+        provider_params have been replaced or edited since.
+        """
+        base_request = self._build_base_request()
+        # Pre-encode the static request fields so only messages are serialized per call
+        static_fragment = orjson.dumps(base_request)[1:-1]  # strip outer braces
+        # One assignment, so a concurrent call never pairs a skeleton with another's fragment
+        self._request_template = (
+            dict(self.common_params), dict(self.provider_params), base_request, static_fragment
+        )
+    
+    def _current_base_request(self) -> Dict[str, Any]:
+        """Return the request skeleton, rebuilding it if the parameters changed."""
+        common_params, provider_params, base_request, _ = self._request_template
+        if common_params != self.common_params or provider_params != self.provider_params:
+            self._update_base_request()
+            base_request = self._request_template[2]
+        return base_request
+    
     def _prepare_request(self, messages: List[Dict[str, Any]], stream: bool = False, enable_reasoning: bool = False) -> Dict[str, Any]:
         """Convert unified format to OpenAI-compatible format.
         
@@ -168,47 +855,66 @@ class OpenAILike(BaseProvider):
         Returns:
             OpenAI-compatible request dictionary
         """
-        # Convert multimodal content if present
-        converted_messages = []
-        for message in messages:
-            converted_msg = message.copy()
-            
-            # Handle multimodal content
-            if isinstance(message.get('content'), list):
-                content_parts = []
-                for part in message['content']:
-                    if part['type'] == 'text':
-                        content_parts.append({
-                            'type': 'text',
-                            'text': part['text']
-                        })
-                    elif part['type'] == 'image':
-                        # Convert to OpenAI image format
-                        content_parts.append({
-                            'type': 'image_url',
-                            'image_url': {
-                                'url': f"data:image/jpeg;base64,{part['image_data']}"
-                            }
-                        })
-                converted_msg['content'] = content_parts
-            
-            converted_messages.append(converted_msg)
-        
-        # Build request with configured parameters
-        request = {
-            'model': self.model_id,
+        if all(isinstance(message.get('content'), str) for message in messages):
+            # Plain-text conversations are already in OpenAI format and the
+            # request is only read, so pass them through without copying
+            converted_messages = messages
+        else:
+            # Convert multimodal content; text messages still pass through
+            converted_messages = [
+                self._convert_multimodal_message(message)
+                if isinstance(message.get('content'), list) else message
+                for message in messages
+            ]
+        
+        # Build request on top of the precomputed skeleton (params and tools)
+        return {
+            **self._current_base_request(),
             'messages': converted_messages,
-            'stream': stream,
-            **self.common_params,      # Add all common parameters
-            **self.provider_params     # Add all provider-specific parameters
+            'stream': stream
         }
+    
+    def _encode_request(self, request: Dict[str, Any]) -> bytes:
+        """Serialize a request body, splicing in the pre-encoded static fields.
         
-        # Add tools if available
-        if self.tools:
-            request['tools'] = self._construct_tools(self.tools)
-            request['tool_choice'] = 'auto'
+        Falls back to a full encode if any static field was replaced, or the
+        skeleton was rebuilt after the request was prepared.
+        
+        Args:
+            request: OpenAI-compatible request built by _prepare_request
+            
+        Returns:
+            JSON request body
+        """
+        _, _, static_fields, static_fragment = self._request_template
+        if any(request.get(key) is not value for key, value in static_fields.items()):
+            return orjson.dumps(request)
+        
+        dynamic = {key: value for key, value in request.items() if key not in static_fields}
+        # Splice '{' + static + ',' + dynamic without its opening brace
+        return b'{' + static_fragment + b',' + orjson.dumps(dynamic)[1:]
+    
+    def _convert_multimodal_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a message with content blocks to OpenAI format.
+        
+        Conversions are not cached: keying them on content would mean hashing
+        every image, which costs about as much as converting it, and keying on
+        the message object would pin large payloads and go stale when the
+        caller edits the message in place.
         
-        return request
+        Args:
+            message: Message whose content is a list of unified content blocks
+            
+        Returns:
+            Copy of the message with OpenAI-compatible content parts
+        """
+        converted = message.copy()
+        converted['content'] = [
+            _PART_CONVERTERS[part['type']](part)
+            for part in message['content']
+            if part['type'] in _PART_CONVERTERS
+        ]
+        return converted
     
     def _execute_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Execute OpenAI-compatible API call.
@@ -222,30 +928,85 @@ class OpenAILike(BaseProvider):
         Raises:
             ProviderError: If API call fails
         """
-        try:
-            response = self.client.post(
-                f"{self.base_url}/chat/completions",
-                json=request
-            )
+        content = self._encode_request(request)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.post(
+                    self._chat_url,
+                    content=content
+                )
+            except httpx.RequestError as e:
+                if attempt < self.max_retries and isinstance(e, _UNSENT_REQUEST_ERRORS):
+                    time.sleep(retry_delay(attempt, self.backoff_base, self.backoff_max))
+                    continue
+                raise ProviderError(f"Request failed: {e}", provider="openai_like")
+            
+            if response.status_code in self.RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                time.sleep(retry_delay(
+                    attempt, self.backoff_base, self.backoff_max, response.headers.get('Retry-After')
+                ))
+                continue
             
             if response.status_code != 200:
-                error_detail = response.text
-                try:
-                    error_json = response.json()
-                    error_detail = error_json.get('error', {}).get('message', error_detail)
-                except:
-                    pass
-                
-                raise ProviderError(
-                    f"API request failed: {error_detail}",
-                    provider="openai_like",
-                    status_code=response.status_code
-                )
+                raise self._api_error(response)
             
-            return response.json()
+            return orjson.loads(response.content)
+    
+    async def _aexecute_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute OpenAI-compatible API call over the async client.
+        
+        Args:
+            request: OpenAI-compatible request
             
-        except httpx.RequestError as e:
-            raise ProviderError(f"Request failed: {e}", provider="openai_like")
+        Returns:
+            OpenAI-compatible response
+            
+        Raises:
+            ProviderError: If API call fails
+        """
+        content = self._encode_request(request)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.async_client.post(self._chat_url, content=content)
+            except httpx.RequestError as e:
+                if attempt < self.max_retries and isinstance(e, _UNSENT_REQUEST_ERRORS):
+                    await asyncio.sleep(retry_delay(attempt, self.backoff_base, self.backoff_max))
+                    continue
+                raise ProviderError(f"Request failed: {e}", provider="openai_like")
+            
+            if response.status_code in self.RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                await asyncio.sleep(retry_delay(
+                    attempt, self.backoff_base, self.backoff_max, response.headers.get('Retry-After')
+                ))
+                continue
+            
+            if response.status_code != 200:
+                raise self._api_error(response)
+            
+            return orjson.loads(response.content)
+    
+    def _api_error(self, response: httpx.Response, streaming: bool = False) -> ProviderError:
+        """Convert a failed (fully read) HTTP response to ProviderError.
+        
+        401 and 404 usually mean a wrong API key, base_url or model_id (what
+        the opt-in connection probe checks), so their message names the
+        endpoint and model to make that obvious.
+        """
+        error_detail = _extract_error_detail(response)
+        
+        label = "Streaming API request failed" if streaming else "API request failed"
+        if response.status_code in (401, 404):
+            label = (
+                f"{label}: endpoint {self.base_url} rejected the request "
+                f"({response.status_code}) for model '{self.model_id}'"
+            )
+        return ProviderError(
+            f"{label}: {error_detail}",
+            provider="openai_like",
+            status_code=response.status_code
+        )
     
     def _execute_stream_request(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """Execute OpenAI-compatible streaming API call.
@@ -262,40 +1023,61 @@ class OpenAILike(BaseProvider):
         try:
             with self.client.stream(
                 'POST',
-                f"{self.base_url}/chat/completions",
-                json=request
+                self._chat_url,
+                content=self._encode_request(request)
             ) as response:
                 if response.status_code != 200:
-                    error_detail = response.text
+                    response.read()
+                    raise self._api_error(response, streaming=True)
+                
+                # Process streaming response as raw bytes
+                for data in _iter_sse_data(response.iter_bytes()):
                     try:
-                        error_json = response.json()
-                        error_detail = error_json.get('error', {}).get('message', error_detail)
-                    except:
-                        pass
-                    
-                    raise ProviderError(
-                        f"Streaming API request failed: {error_detail}",
-                        provider="openai_like",
-                        status_code=response.status_code
-                    )
+                        yield orjson.loads(data)
+                    except orjson.JSONDecodeError:
+                        continue
+
+        except httpx.RequestError as e:
+            raise ProviderError(f"Streaming request failed: {e}", provider="openai_like")
+    
+    async def _aexecute_stream_request(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Execute OpenAI-compatible streaming API call over the async client.
+        
+        Args:
+            request: OpenAI-compatible request
+            
+        Yields:
+            OpenAI-compatible response chunks
+            
+        Raises:
+            ProviderError: If streaming API call fails
+        """
+        try:
+            async with self.async_client.stream(
+                'POST',
+                self._chat_url,
+                content=self._encode_request(request)
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise self._api_error(response, streaming=True)
                 
-                # Process streaming response
-                for line in response.iter_lines():
-                    if line:
-                        # Handle both bytes and string cases
-                        if isinstance(line, bytes):
-                            line = line.decode('utf-8')
-                        
-                        if line.startswith('data: '):
-                            data = line[6:]  # Remove 'data: ' prefix
-                            if data == '[DONE]':
-                                break
-                            try:
-                                chunk = json.loads(data)
-                                yield chunk
-                            except json.JSONDecodeError:
-                                continue
-                                
+                parser = _SSEParser()
+                async for chunk in response.aiter_bytes():
+                    for data in parser.feed(chunk):
+                        try:
+                            yield orjson.loads(data)
+                        except orjson.JSONDecodeError:
+                            continue
+                    if parser.done:
+                        return
+                
+                for data in parser.flush():
+                    try:
+                        yield orjson.loads(data)
+                    except orjson.JSONDecodeError:
+                        continue
+
         except httpx.RequestError as e:
             raise ProviderError(f"Streaming request failed: {e}", provider="openai_like")
     
@@ -337,21 +1119,12 @@ class OpenAILike(BaseProvider):
         if not full_content:
             return "", None
         
-        # Common reasoning patterns
-        patterns = [
-            (r'<think>(.*?)</think>', re.DOTALL),
-            (r'<thinking>(.*?)</thinking>', re.DOTALL), 
-            (r'<reasoning>(.*?)</reasoning>', re.DOTALL),
-            (r'<analysis>(.*?)</analysis>', re.DOTALL),
-        ]
-        
-        for pattern, flags in patterns:
-            match = re.search(pattern, full_content, flags)
-            if match:
-                reasoning_content = match.group(1).strip()
-                # Remove reasoning section from final content
-                final_content = re.sub(pattern, '', full_content, flags=flags).strip()
-                return final_content, reasoning_content
+        match = _REASONING_BLOCK.search(full_content)
+        if match:
+            reasoning_content = match.group(2).strip()
+            # Remove reasoning sections from final content
+            final_content = _REASONING_PATTERNS[match.group(1)].sub('', full_content).strip()
+            return final_content, reasoning_content
         
         # Method 4: Check for reasoning tokens in usage (OpenAI o1)
         usage = response.get('usage', {})
@@ -413,18 +1186,31 @@ class OpenAILike(BaseProvider):
             metadata=metadata
         )
     
-    def _parse_stream_response(self, chunk: Dict[str, Any], enable_reasoning: bool = False) -> ChatStreamResponse:
+    def _parse_stream_response(
+        self,
+        chunk: Dict[str, Any],
+        enable_reasoning: bool = False,
+        state: Optional[_ReasoningTagState] = None
+    ) -> ChatStreamResponse:
         """Parse OpenAI streaming response chunk to unified format.
         
         Args:
             chunk: OpenAI-compatible response chunk
             enable_reasoning: Whether reasoning is enabled
+            state: Reasoning-tag state of the stream the chunk belongs to
+                   (a chunk parsed on its own starts outside reasoning)
             
         Returns:
             ChatStreamResponse in unified format with standardized tool calls
         """
         if not chunk.get("choices"):
-            return ChatStreamResponse(delta="", metadata={"raw_chunk": chunk})
+            # e.g. the trailing usage-only chunk
+            metadata = {"model": chunk.get("model"), "provider": "openai_like"}
+            if 'usage' in chunk:
+                metadata['usage'] = chunk['usage']
+            if self.include_raw_chunk:
+                metadata['raw_chunk'] = chunk
+            return ChatStreamResponse(delta="", metadata=metadata)
         
         choice = chunk["choices"][0]
         delta = choice.get("delta", {})
@@ -432,9 +1218,10 @@ class OpenAILike(BaseProvider):
         # Extract content delta
         content_delta = delta.get("content") or ""
         
-        # Extract tool calls and standardize them internally
+        # Extract tool calls and standardize them internally. Most chunks carry
+        # none, so skip the standardization call (and its list) entirely.
         raw_tool_calls = delta.get("tool_calls")
-        standardized_tool_calls = self._standardize_tool_calls(raw_tool_calls or [])
+        standardized_tool_calls = self._standardize_tool_calls(raw_tool_calls) if raw_tool_calls else None
         
         # Handle reasoning in streaming
         reasoning_delta = None
@@ -451,22 +1238,23 @@ class OpenAILike(BaseProvider):
             # For pattern-based reasoning, detect start/end transitions
             if content_delta and reasoning_delta is None:
                 full_delta = content_delta
+                if state is None:
+                    state = _ReasoningTagState()
                 
-                # Check for reasoning START (opening tags)
-                opening_tags = ['<think>', '<thinking>', '<reasoning>', '<analysis>']
-                if any(tag in full_delta for tag in opening_tags):
-                    self._in_reasoning_mode = True
-                    print(f"🧠 Reasoning started detected in chunk")  # Debug
-                
-                # Check for reasoning END (closing tags)
-                closing_tags = ['</think>', '</thinking>', '</reasoning>', '</analysis>']
-                if any(tag in full_delta for tag in closing_tags):
-                    self._in_reasoning_mode = False
-                    is_reasoning_complete = True
-                    print(f"✅ Reasoning completed detected in chunk")  # Debug
+                # Detect reasoning START/END transitions in one scan over the delta
+                for tag in _REASONING_TAG.finditer(full_delta):
+                    if tag.group(1):
+                        state.in_reasoning = False
+                        is_reasoning_complete = True
+                        if _log.isEnabledFor(logging.DEBUG):
+                            _log.debug("Reasoning completed in chunk %r", full_delta[:40])
+                    else:
+                        state.in_reasoning = True
+                        if _log.isEnabledFor(logging.DEBUG):
+                            _log.debug("Reasoning started in chunk %r", full_delta[:40])
                 
                 # Route content based on current reasoning state
-                if self._in_reasoning_mode:
+                if state.in_reasoning:
                     # We're in reasoning mode - this delta is reasoning content
                     reasoning_delta = content_delta
                     content_delta = ""  # Don't emit as content
@@ -476,15 +1264,17 @@ class OpenAILike(BaseProvider):
                     pass
         
         # Check if stream is complete
-        is_complete = choice.get("finish_reason") is not None
+        finish_reason = choice.get("finish_reason")
+        is_complete = finish_reason is not None
         
         # Build metadata
         metadata = {
             "model": chunk.get("model"),
-            "finish_reason": choice.get("finish_reason"),
-            "raw_chunk": chunk,
+            "finish_reason": finish_reason,
             "provider": "openai_like"
         }
+        if self.include_raw_chunk:
+            metadata['raw_chunk'] = chunk
         
         # Add usage information if available (usually only in final chunk)
         if 'usage' in chunk:
@@ -495,7 +1285,7 @@ class OpenAILike(BaseProvider):
             reasoning_delta=reasoning_delta,
             is_reasoning_complete=is_reasoning_complete,
             is_complete=is_complete,
-            tool_calls=standardized_tool_calls if standardized_tool_calls else None,
+            tool_calls=standardized_tool_calls or None,
             metadata=metadata
         )
     
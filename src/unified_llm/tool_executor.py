@@ -1,7 +1,9 @@
 """Tool execution utility for unified LLM interface."""
 
-from typing import List, Callable, Dict, Any
-from .utils import execute_function_call
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Callable, Dict, Any, Optional, Tuple
+from .utils import execute_function_call, aexecute_function_call
 from .exceptions import ToolExecutionError
 
 
@@ -19,13 +21,13 @@ class ToolExecutor:
         Args:
             tools: List of callable functions that can be executed
         """
-        self.tools_by_name = {}
-        
-        # Build tool registry
         for tool in tools:
             if not callable(tool):
                 raise ValueError(f"Tool {tool} must be callable")
-            self.tools_by_name[tool.__name__] = tool
+        
+        # Build tool registry; the name list is reused in every not-found error
+        self.tools_by_name: Dict[str, Callable] = {tool.__name__: tool for tool in tools}
+        self._available_tools = ", ".join(self.tools_by_name)
     
     def execute(self, tool_call: Dict[str, Any]) -> str:
         """Execute a single tool call with comprehensive error handling.
@@ -45,32 +47,44 @@ class ToolExecutor:
             ... })
             >>> print(result)  # "Weather in New York: sunny, 22°C"
         """
+        tool_name = None
         try:
-            # Validate tool call structure
-            if not isinstance(tool_call, dict):
-                return "Error: Tool call must be a dictionary"
+            error, tool_func = self._resolve(tool_call)
+            if error is not None:
+                return error
+            tool_name = tool_call["name"]
             
-            tool_name = tool_call.get("name")
-            tool_args = tool_call.get("arguments", "{}")
-            tool_id = tool_call.get("id")
-            
-            # Validate required fields
-            if not tool_name:
-                return "Error: Missing tool name in tool call"
+            # Execute the tool
+            result = execute_function_call(tool_func, tool_call.get("arguments", "{}"))
             
-            if not tool_id:
-                return "Error: Missing tool call ID"
+            # Ensure result is a string
+            return str(result)
             
-            # Check if tool exists
-            if tool_name not in self.tools_by_name:
-                available_tools = ", ".join(self.tools_by_name.keys())
-                return f"Error: Tool '{tool_name}' not found. Available tools: {available_tools}"
+        except ToolExecutionError as e:
+            return f"Tool execution error: {e}"
+        except Exception as e:
+            return f"Unexpected error executing tool '{tool_name}': {e}"
+    
+    async def aexecute(self, tool_call: Dict[str, Any]) -> str:
+        """Execute a single tool call without blocking the event loop.
+        
+        Coroutine tools are awaited; regular tools run in a worker thread.
+        Error handling matches execute().
+        
+        Args:
+            tool_call: Tool call dictionary with 'name', 'arguments', 'id' fields
             
-            # Execute the tool
-            tool_func = self.tools_by_name[tool_name]
-            result = execute_function_call(tool_func, tool_args)
+        Returns:
+            String result of tool execution (success result or error message)
+        """
+        tool_name = None
+        try:
+            error, tool_func = self._resolve(tool_call)
+            if error is not None:
+                return error
+            tool_name = tool_call["name"]
             
-            # Ensure result is a string
+            result = await aexecute_function_call(tool_func, tool_call.get("arguments", "{}"))
             return str(result)
             
         except ToolExecutionError as e:
@@ -78,6 +92,35 @@ class ToolExecutor:
         except Exception as e:
             return f"Unexpected error executing tool '{tool_name}': {e}"
     
+    def _resolve(self, tool_call: Dict[str, Any]) -> Tuple[Optional[str], Optional[Callable]]:
+        """Validate a tool call's structure and look up its function.
+        
+        Args:
+            tool_call: Tool call dictionary
+            
+        Returns:
+            Tuple of (error message or None, tool function or None)
+        """
+        # Validate tool call structure
+        if not isinstance(tool_call, dict):
+            return "Error: Tool call must be a dictionary", None
+        
+        tool_name = tool_call.get("name")
+        
+        # Validate required fields
+        if not tool_name:
+            return "Error: Missing tool name in tool call", None
+        
+        if not tool_call.get("id"):
+            return "Error: Missing tool call ID", None
+        
+        # Check if tool exists
+        tool_func = self.tools_by_name.get(tool_name)
+        if tool_func is None:
+            return f"Error: Tool '{tool_name}' not found. Available tools: {self._available_tools}", None
+        
+        return None, tool_func
+    
     def execute_all(self, tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Execute multiple tool calls and return formatted results.
         
@@ -96,21 +139,53 @@ class ToolExecutor:
             >>> results = executor.execute_all(tool_calls)
             >>> # Returns formatted tool result messages
         """
-        results = []
+        return [self._tool_result(tool_call, self.execute(tool_call)) for tool_call in tool_calls]
+    
+    def execute_all_concurrent(self, tool_calls: List[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """Execute multiple tool calls in parallel threads.
+        
+        Useful when a model requests several I/O-bound tools (HTTP, database)
+        at once. Results keep the order of tool_calls.
         
-        for tool_call in tool_calls:
-            result_content = self.execute(tool_call)
-            tool_id = tool_call.get("id", "unknown")
+        Args:
+            tool_calls: List of tool call dictionaries
+            max_workers: Maximum number of tools running at once
             
-            # Format as tool result message
-            tool_result = {
-                "role": "tool",
-                "content": result_content,
-                "tool_call_id": tool_id
-            }
-            results.append(tool_result)
-        
-        return results
+        Returns:
+            List of tool result message dictionaries ready for conversation
+        """
+        if len(tool_calls) <= 1:
+            return self.execute_all(tool_calls)
+        
+        # Submit everything first, then collect, so the calls actually overlap
+        with ThreadPoolExecutor(max_workers=min(len(tool_calls), max_workers)) as pool:
+            futures = [pool.submit(self.execute, tool_call) for tool_call in tool_calls]
+            return [self._tool_result(tool_call, future.result()) for tool_call, future in zip(tool_calls, futures)]
+    
+    async def aexecute_all(self, tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute multiple tool calls concurrently on the event loop.
+        
+        Coroutine tools are awaited together; regular tools run in worker
+        threads. Results keep the order of tool_calls.
+        
+        Args:
+            tool_calls: List of tool call dictionaries
+            
+        Returns:
+            List of tool result message dictionaries ready for conversation
+        """
+        contents = await asyncio.gather(*(self.aexecute(tool_call) for tool_call in tool_calls))
+        return [self._tool_result(tool_call, content) for tool_call, content in zip(tool_calls, contents)]
+    
+    @staticmethod
+    def _tool_result(tool_call: Dict[str, Any], content: str) -> Dict[str, Any]:
+        """Format a tool's output as a tool result message."""
+        tool_id = tool_call.get("id", "unknown") if isinstance(tool_call, dict) else "unknown"
+        return {
+            "role": "tool",
+            "content": content,
+            "tool_call_id": tool_id
+        }
     
     def get_available_tools(self) -> List[str]:
         """Get list of available tool names.
@@ -156,7 +231,6 @@ class ToolExecutor:
         # Check if tool exists
         tool_name = tool_call.get("name")
         if tool_name and tool_name not in self.tools_by_name:
-            available = ", ".join(self.tools_by_name.keys())
-            errors.append(f"Tool '{tool_name}' not found. Available: {available}")
+            errors.append(f"Tool '{tool_name}' not found. Available: {self._available_tools}")
         
         return errors 
\ No newline at end of file
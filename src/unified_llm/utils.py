@@ -1,28 +1,89 @@
 """Utility functions for unified LLM interface."""
 
+import asyncio
+import contextlib
+import contextvars
+import functools
 import inspect
-import json
-from typing import Callable, Dict, List, Any, get_type_hints
-from .exceptions import ValidationError
+import random
+import time
+from typing import Callable, Dict, Iterator, List, Any, Optional, get_origin, get_type_hints
+import orjson
+from .exceptions import ToolExecutionError, ValidationError
+
+
+# Python annotation -> JSON schema type for tool parameters
+_PRIMITIVE_JSON_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+# Generic origin (List[int] -> list, etc.) -> JSON schema type
+_ORIGIN_JSON_TYPES = {
+    list: "array",
+    tuple: "array",
+    set: "array",
+    dict: "object",
+}
 
 
 def extract_function_schema(func: Callable) -> Dict[str, Any]:
     """Extract function schema from a Python function for tool use.
     
+    Schemas are cached per function, so registering the same tools with
+    several providers only inspects each function once. Every call returns
+    a fresh copy that callers may modify.
+    
     Args:
         func: Python function to extract schema from
         
     Returns:
         Dictionary containing function name, description, and parameter schema
     """
+    try:
+        schema = _cached_function_schema(func)
+    except TypeError:
+        # Unhashable callable; nothing to key the cache on
+        schema = _build_function_schema(func)
+    
+    parameters = schema["parameters"]
+    return {
+        "name": schema["name"],
+        "description": schema["description"],
+        "parameters": {
+            "type": parameters["type"],
+            "properties": {name: dict(info) for name, info in parameters["properties"].items()},
+            "required": list(parameters["required"])
+        }
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_function_schema(func: Callable) -> Dict[str, Any]:
+    """Build the schema for a hashable function once (shared; do not mutate)."""
+    return _build_function_schema(func)
+
+
+def _build_function_schema(func: Callable) -> Dict[str, Any]:
+    """Inspect a function's signature, docstring and type hints into a tool schema."""
     signature = inspect.signature(func)
     docstring = inspect.getdoc(func) or f"Function {func.__name__}"
     
-    # Get type hints
+    # Get type hints. Plain annotations are already evaluated, so only pay
+    # for get_type_hints' name resolution when some are strings (PEP 563)
     try:
-        type_hints = get_type_hints(func)
-    except (NameError, AttributeError):
+        type_hints = inspect.get_annotations(func)
+    except TypeError:
         type_hints = {}
+    if any(isinstance(hint, str) for hint in type_hints.values()):
+        try:
+            type_hints = get_type_hints(func)
+        except (NameError, AttributeError, TypeError):
+            pass
     
     properties = {}
     required = []
@@ -39,18 +100,10 @@ def extract_function_schema(func: Callable) -> Dict[str, Any]:
         # Extract type information
         if param_name in type_hints:
             python_type = type_hints[param_name]
-            if python_type == str:
-                param_info["type"] = "string"
-            elif python_type == int:
-                param_info["type"] = "integer"
-            elif python_type == float:
-                param_info["type"] = "number"
-            elif python_type == bool:
-                param_info["type"] = "boolean"
-            elif hasattr(python_type, '__origin__') and python_type.__origin__ == list:
-                param_info["type"] = "array"
-            elif hasattr(python_type, '__origin__') and python_type.__origin__ == dict:
-                param_info["type"] = "object"
+            param_info["type"] = (
+                _PRIMITIVE_JSON_TYPES.get(python_type)
+                or _ORIGIN_JSON_TYPES.get(get_origin(python_type), "string")
+            )
         
         properties[param_name] = param_info
         
@@ -69,6 +122,44 @@ def extract_function_schema(func: Callable) -> Dict[str, Any]:
     }
 
 
+# Roles accepted by validate_messages
+_VALID_ROLES = frozenset({"system", "user", "assistant", "tool"})
+
+# Content block type -> fields of which at least one must be present;
+# add new block types here
+_BLOCK_REQUIRED_FIELDS = {
+    "text": ("text",),
+    "image": ("image_data", "image_bytes"),
+}
+
+# Sentinel for absent dict keys (None is a legal field value)
+_MISSING = object()
+
+# Set by skip_validation(); per thread / asyncio task
+_SKIP_VALIDATION: contextvars.ContextVar[bool] = contextvars.ContextVar("skip_validation", default=False)
+
+
+@contextlib.contextmanager
+def skip_validation() -> Iterator[None]:
+    """Turn validate_messages into a no-op within the block.
+    
+    Meant for trusted code that builds messages programmatically and is
+    sensitive to per-request overhead. Malformed messages then fail later
+    (or at the API) with less helpful errors, so this is not recommended
+    except as a targeted performance optimization. The setting is held in a
+    context variable, so it only affects the current thread or asyncio task.
+    
+    Examples:
+        >>> with skip_validation():
+        ...     response = provider.chat(messages)
+    """
+    token = _SKIP_VALIDATION.set(True)
+    try:
+        yield
+    finally:
+        _SKIP_VALIDATION.reset(token)
+
+
 def validate_messages(messages: List[Dict[str, Any]]) -> None:
     """Validate message format according to OpenAI-compatible standard.
     
@@ -78,73 +169,232 @@ def validate_messages(messages: List[Dict[str, Any]]) -> None:
     Raises:
         ValidationError: If messages don't conform to expected format
     """
+    if _SKIP_VALIDATION.get():
+        return
+    
     if not isinstance(messages, list):
         raise ValidationError("Messages must be a list")
     
     if not messages:
         raise ValidationError("Messages list cannot be empty")
     
-    valid_roles = {"system", "user", "assistant", "tool"}
+    # Well-formed histories pass the bulk check; otherwise walk the messages
+    # one by one to report the first problem precisely
+    if _messages_look_valid(messages):
+        return
     
     for i, message in enumerate(messages):
         if not isinstance(message, dict):
             raise ValidationError(f"Message {i} must be a dictionary")
         
-        if "role" not in message:
+        # Single lookups on the happy path; error messages are only built on failure
+        role = message.get("role", _MISSING)
+        if role is _MISSING:
             raise ValidationError(f"Message {i} missing 'role' field")
         
-        if "content" not in message:
+        content = message.get("content", _MISSING)
+        if content is _MISSING:
             raise ValidationError(f"Message {i} missing 'content' field")
         
-        role = message["role"]
-        if role not in valid_roles:
-            raise ValidationError(f"Message {i} has invalid role '{role}'. Must be one of: {valid_roles}")
-        
-        content = message["content"]
+        if not isinstance(role, str) or role not in _VALID_ROLES:
+            raise ValidationError(f"Message {i} has invalid role '{role}'. Must be one of: {set(_VALID_ROLES)}")
         
         # Validate content format
         if isinstance(content, str):
             # Simple text content
-            continue
+            pass
         elif isinstance(content, list):
             # Multimodal content blocks
             for j, block in enumerate(content):
-                if not isinstance(block, dict):
-                    raise ValidationError(f"Message {i}, content block {j} must be a dictionary")
-                
-                if "type" not in block:
-                    raise ValidationError(f"Message {i}, content block {j} missing 'type' field")
-                
-                block_type = block["type"]
-                if block_type == "text":
-                    if "text" not in block:
-                        raise ValidationError(f"Message {i}, content block {j} of type 'text' missing 'text' field")
-                elif block_type == "image":
-                    if "image_data" not in block:
-                        raise ValidationError(f"Message {i}, content block {j} of type 'image' missing 'image_data' field")
-                else:
-                    raise ValidationError(f"Message {i}, content block {j} has unsupported type '{block_type}'")
+                _validate_content_block(block, i, j)
         else:
             raise ValidationError(f"Message {i} content must be string or list of content blocks")
         
         # Additional validation for tool role
-        if role == "tool":
-            if "tool_call_id" not in message:
-                raise ValidationError(f"Message {i} with role 'tool' missing 'tool_call_id' field")
+        if role == "tool" and "tool_call_id" not in message:
+            raise ValidationError(f"Message {i} with role 'tool' missing 'tool_call_id' field")
+
+
+def _messages_look_valid(messages: List[Any]) -> bool:
+    """Check a message list column-wise, without building error messages.
+    
+    Pulls all roles and contents out in two comprehensions and checks them
+    in bulk. Returns False on anything unusual (not only on errors) so that
+    validate_messages' detailed loop stays the single source of truth.
+    
+    Args:
+        messages: Non-empty list of messages
+        
+    Returns:
+        True if every message is known to be valid
+    """
+    try:
+        # dict.get raises TypeError for anything that is not a dict
+        roles = {dict.get(message, "role") for message in messages}
+        contents = [dict.get(message, "content", _MISSING) for message in messages]
+    except TypeError:
+        return False
+    
+    if not _VALID_ROLES.issuperset(roles):
+        return False
+    
+    if "tool" in roles and not all(
+        "tool_call_id" in message for message in messages if message["role"] == "tool"
+    ):
+        return False
+    
+    for content in contents:
+        if type(content) is str:
+            continue
+        if type(content) is not list:
+            return False
+        for block in content:
+            if type(block) is not dict:
+                return False
+            try:
+                fields = _BLOCK_REQUIRED_FIELDS.get(block.get("type"))
+            except TypeError:
+                # Unhashable type value
+                return False
+            if fields is None:
+                return False
+            for field in fields:
+                if field in block:
+                    break
+            else:
+                return False
+    return True
+
+
+def _validate_content_block(block: Any, i: int, j: int) -> None:
+    """Validate one multimodal content block of message i.
+    
+    Args:
+        block: Content block to check
+        i: Index of the enclosing message (for error messages)
+        j: Index of the block within the message content
+        
+    Raises:
+        ValidationError: If the block is malformed
+    """
+    if not isinstance(block, dict):
+        raise ValidationError(f"Message {i}, content block {j} must be a dictionary")
+    
+    block_type = block.get("type", _MISSING)
+    if block_type is _MISSING:
+        raise ValidationError(f"Message {i}, content block {j} missing 'type' field")
+    
+    fields = _BLOCK_REQUIRED_FIELDS.get(block_type) if isinstance(block_type, str) else None
+    if fields is None:
+        raise ValidationError(f"Message {i}, content block {j} has unsupported type '{block_type}'")
+    
+    if not any(field in block for field in fields):
+        missing = " or ".join(f"'{field}'" for field in fields)
+        raise ValidationError(f"Message {i}, content block {j} of type '{block_type}' missing {missing} field")
+
+
+# Delimiters of text-embedded tool calls (Hermes/Qwen style)
+_TOOL_CALL_OPEN = "<tool_call>"
+_TOOL_CALL_CLOSE = "</tool_call>"
 
 
 def parse_tool_calls(content: str) -> List[Dict[str, Any]]:
-    """Parse tool calls from assistant message content.
+    """Parse tool calls embedded in assistant message text.
+    
+    Handles the <tool_call>{"name": ..., "arguments": {...}}</tool_call>
+    format that Hermes/Qwen-style models emit when the server does not
+    extract tool calls itself. Spans are located with str.find, so the
+    scan is linear in the content length however malformed the model
+    output is; spans that are not valid tool-call JSON are skipped.
     
     Args:
         content: Raw content that might contain tool calls
         
     Returns:
-        List of parsed tool call dictionaries
+        List of tool calls in the standardized format
+        ({"id", "name", "arguments"} with arguments as a JSON string)
+    """
+    tool_calls = []
+    if _TOOL_CALL_OPEN not in content:
+        return tool_calls
+    
+    position = 0
+    while True:
+        start = content.find(_TOOL_CALL_OPEN, position)
+        if start == -1:
+            break
+        start += len(_TOOL_CALL_OPEN)
+        end = content.find(_TOOL_CALL_CLOSE, start)
+        if end == -1:
+            break
+        position = end + len(_TOOL_CALL_CLOSE)
+        
+        try:
+            call = orjson.loads(content[start:end])
+        except orjson.JSONDecodeError:
+            continue
+        if not isinstance(call, dict) or not isinstance(call.get("name"), str):
+            continue
+        
+        arguments = call.get("arguments", {})
+        if not isinstance(arguments, str):
+            arguments = orjson.dumps(arguments).decode("utf-8")
+        tool_calls.append({
+            "id": f"call_{len(tool_calls)}",
+            "name": call["name"],
+            "arguments": arguments
+        })
+    
+    return tool_calls
+
+
+def _result_to_str(result: Any) -> str:
+    """Convert a tool's return value to the string sent back to the model.
+    
+    Dicts, lists and tuples are serialized as JSON (not Python repr) so the
+    model gets something it can parse. Bytes are decoded as UTF-8 rather
+    than rendered as "b'...'", and None becomes an empty string.
+    """
+    result_type = type(result)
+    if result_type is str:
+        return result
+    if result_type in (dict, list, tuple):
+        try:
+            return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. nesting too deep or integers beyond 64 bits
+            return str(result)
+    if result_type is bytes:
+        return result.decode("utf-8", "replace")
+    if result is None:
+        return ""
+    return str(result)
+
+
+def _parse_arguments(arguments: Any) -> Dict[str, Any]:
+    """Parse tool-call arguments once; dicts from callers pass straight through."""
+    if isinstance(arguments, (str, bytes)):
+        return orjson.loads(arguments)
+    return arguments
+
+
+def _tool_error(func: Callable, error: Exception) -> ToolExecutionError:
+    """Wrap a failure from parsing arguments or running a tool.
+    
+    Args:
+        func: Tool function that was being called
+        error: Exception raised while parsing arguments or executing func
+        
+    Returns:
+        ToolExecutionError describing the failure
     """
-    # This is a simplified implementation
-    # In practice, you'd parse the actual tool call format from the provider
-    return []
+    if isinstance(error, orjson.JSONDecodeError):
+        message = f"Invalid JSON arguments: {error}"
+    elif isinstance(error, TypeError):
+        message = f"Invalid function arguments: {error}"
+    else:
+        message = f"Function execution failed: {error}"
+    return ToolExecutionError(message, tool_name=func.__name__, original_error=error)
 
 
 def execute_function_call(func: Callable, arguments: str) -> str:
@@ -152,7 +402,7 @@ def execute_function_call(func: Callable, arguments: str) -> str:
     
     Args:
         func: Function to execute
-        arguments: JSON string containing function arguments
+        arguments: JSON string (or already-parsed dict) of function arguments
         
     Returns:
         String result of function execution
@@ -160,27 +410,90 @@ def execute_function_call(func: Callable, arguments: str) -> str:
     Raises:
         ToolExecutionError: If function execution fails
     """
-    from .exceptions import ToolExecutionError
-    
     try:
-        # Parse arguments
-        if isinstance(arguments, str):
-            args_dict = json.loads(arguments)
-        else:
-            args_dict = arguments
+        result = func(**_parse_arguments(arguments))
+        return _result_to_str(result)
+    except Exception as e:
+        raise _tool_error(func, e)
+
+
+async def aexecute_function_call(func: Callable, arguments: str) -> str:
+    """Execute a function call with JSON arguments without blocking the event loop.
+    
+    Same parsing, result conversion and errors as execute_function_call;
+    coroutine functions are awaited directly and regular functions run in
+    a worker thread.
+    
+    Args:
+        func: Function (sync or async) to execute
+        arguments: JSON string (or already-parsed dict) of function arguments
         
-        # Execute function
-        result = func(**args_dict)
+    Returns:
+        String result of function execution
         
-        # Convert result to string
-        if isinstance(result, str):
-            return result
+    Raises:
+        ToolExecutionError: If function execution fails
+    """
+    try:
+        args_dict = _parse_arguments(arguments)
+        if inspect.iscoroutinefunction(func):
+            result = await func(**args_dict)
         else:
-            return str(result)
-            
-    except json.JSONDecodeError as e:
-        raise ToolExecutionError(f"Invalid JSON arguments: {e}", tool_name=func.__name__, original_error=e)
-    except TypeError as e:
-        raise ToolExecutionError(f"Invalid function arguments: {e}", tool_name=func.__name__, original_error=e)
+            result = await asyncio.to_thread(func, **args_dict)
+        return _result_to_str(result)
     except Exception as e:
-        raise ToolExecutionError(f"Function execution failed: {e}", tool_name=func.__name__, original_error=e) 
\ No newline at end of file
+        raise _tool_error(func, e)
+
+
+def retry_delay(attempt: int, backoff_base: float, backoff_max: float, retry_after: Optional[str] = None) -> float:
+    """Compute how long to wait before retrying a transient failure.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        backoff_base: Delay for the first retry, doubled on each attempt
+        backoff_max: Upper bound for any delay
+        retry_after: Value of the server's Retry-After header, if any
+        
+    Returns:
+        Delay in seconds: the server-requested delay when given in seconds,
+        otherwise exponential backoff with jitter, capped at backoff_max
+    """
+    if retry_after:
+        try:
+            return min(backoff_max, float(retry_after))
+        except ValueError:
+            pass
+    return min(backoff_max, backoff_base * 2 ** attempt) + random.uniform(0, 0.25)
+
+
+class RateLimiter:
+    """Async rate limiter that spaces acquisitions evenly.
+    
+    Examples:
+        >>> limiter = RateLimiter(5)            # 5 requests per second
+        >>> limiter = RateLimiter(500, per=60)  # 500 requests per minute
+        >>> await limiter.acquire()
+    """
+    
+    def __init__(self, rate: float, per: float = 1.0):
+        """Initialize limiter.
+        
+        Args:
+            rate: Number of acquisitions allowed per period
+            per: Period length in seconds
+        """
+        if rate <= 0:
+            raise ValidationError("Rate must be positive")
+        self.interval = per / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until the next slot is available."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
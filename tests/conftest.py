@@ -0,0 +1,88 @@
+"""Shared fixtures: providers wired to httpx.MockTransport instead of the network."""
+
+import asyncio
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from unified_llm import Bedrock, OpenAILike
+from unified_llm.providers.openai_like import provider as openai_like_module
+
+
+@pytest.fixture
+def make_openai_like() -> Callable[..., OpenAILike]:
+    """Build OpenAILike providers whose sync and async clients use a mock handler.
+    
+    Async clients come from the provider's own per-event-loop factory, so
+    tests exercise the real client lifecycle.
+    """
+    providers: List[OpenAILike] = []
+    async_clients: List[httpx.AsyncClient] = []
+    
+    def make(handler: Callable[[httpx.Request], httpx.Response], **kwargs) -> OpenAILike:
+        kwargs.setdefault('base_url', 'http://test.local')
+        kwargs.setdefault('api_key', 'test-key')
+        provider = OpenAILike('test-model', **kwargs)
+        transport = httpx.MockTransport(handler)
+        provider.client = httpx.Client(transport=transport)
+        
+        def new_async_client() -> httpx.AsyncClient:
+            client = httpx.AsyncClient(transport=transport)
+            async_clients.append(client)
+            return client
+        
+        provider._new_async_client = new_async_client
+        providers.append(provider)
+        return provider
+    
+    yield make
+    
+    for provider in providers:
+        provider.client.close()
+        provider.close()
+    for client in async_clients:
+        asyncio.run(client.aclose())
+
+
+@pytest.fixture
+def make_bedrock() -> Callable[..., Bedrock]:
+    """Build Bedrock providers on the native (SigV4 over httpx) path with a mock handler."""
+    async_clients: List[httpx.AsyncClient] = []
+    
+    def make(handler: Callable[[httpx.Request], httpx.Response], **kwargs) -> Bedrock:
+        kwargs.setdefault('region_name', 'us-east-1')
+        provider = Bedrock(
+            'anthropic.claude-test',
+            aws_access_key_id='AKIDTEST',
+            aws_secret_access_key='secret',
+            **kwargs
+        )
+        transport = httpx.MockTransport(handler)
+        
+        def new_async_client() -> httpx.AsyncClient:
+            client = httpx.AsyncClient(transport=transport)
+            async_clients.append(client)
+            return client
+        
+        provider._new_async_client = new_async_client
+        return provider
+    
+    yield make
+    
+    for client in async_clients:
+        asyncio.run(client.aclose())
+
+
+@pytest.fixture
+def retry_delays(monkeypatch) -> List[tuple]:
+    """Record (attempt, retry_after) for each retry and skip the actual wait."""
+    delays = []
+    
+    def fake_retry_delay(attempt, backoff_base, backoff_max, retry_after=None):
+        delays.append((attempt, retry_after))
+        return 0
+    
+    monkeypatch.setattr(openai_like_module, 'retry_delay', fake_retry_delay)
+    return delays
+
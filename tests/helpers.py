@@ -0,0 +1,55 @@
+"""Small builders shared by the test modules."""
+
+import struct
+import zlib
+
+import orjson
+
+
+def completion(content: str = "ok") -> dict:
+    """Minimal chat completion response body."""
+    return {
+        "model": "test-model",
+        "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+    }
+
+
+def sse_body(*payloads, done: bool = True, newline: bytes = b"\n") -> bytes:
+    """Encode chat completion chunks as a server-sent events body."""
+    lines = [b"data: " + orjson.dumps(payload) for payload in payloads]
+    if done:
+        lines.append(b"data: [DONE]")
+    return b"".join(line + newline + newline for line in lines)
+
+
+def stream_chunk(content: str = "", finish_reason=None, **extra) -> dict:
+    """Minimal chat completion stream chunk."""
+    return {
+        "model": "test-model",
+        "choices": [{"delta": {"content": content}, "finish_reason": finish_reason}],
+        **extra
+    }
+
+
+def event_stream_frame(headers: dict, payload: bytes = b"") -> bytes:
+    """Encode one AWS event-stream message (string headers only)."""
+    encoded_headers = b""
+    for name, value in headers.items():
+        name_bytes, value_bytes = name.encode(), value.encode()
+        encoded_headers += bytes([len(name_bytes)]) + name_bytes + b"\x07"
+        encoded_headers += struct.pack(">H", len(value_bytes)) + value_bytes
+    
+    total_length = 12 + len(encoded_headers) + len(payload) + 4
+    prelude = struct.pack(">II", total_length, len(encoded_headers))
+    prelude += struct.pack(">I", zlib.crc32(prelude))
+    message = prelude + encoded_headers + payload
+    return message + struct.pack(">I", zlib.crc32(message))
+
+
+def converse_event(event_type: str, payload: dict) -> bytes:
+    """Encode a ConverseStream event frame."""
+    return event_stream_frame(
+        {":message-type": "event", ":event-type": event_type, ":content-type": "application/json"},
+        orjson.dumps(payload)
+    )
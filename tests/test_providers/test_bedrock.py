@@ -0,0 +1,510 @@
+"""Tests for the Bedrock provider."""
+
+import asyncio
+import threading
+
+import httpx
+import orjson
+import pytest
+
+from unified_llm import Bedrock, ProviderError
+from unified_llm.providers.bedrock import provider as bedrock_module
+from unified_llm.providers.bedrock.provider import _BedrockStreamState, _StreamCoalescer
+
+from helpers import converse_event, event_stream_frame
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+CONVERSE_RESPONSE = {
+    "output": {"message": {"role": "assistant", "content": [
+        {"reasoningContent": {"reasoningText": {"text": "think"}}},
+        {"text": "hi"},
+        {"toolUse": {"toolUseId": "t1", "name": "add", "input": {"a": 1}}},
+    ]}},
+    "stopReason": "tool_use",
+    "usage": {"inputTokens": 1},
+}
+
+
+def converse_handler(requests=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(200, json=CONVERSE_RESPONSE)
+    return handler
+
+
+# Async client lifecycle
+
+def test_async_calls_work_across_event_loops(make_bedrock):
+    provider = make_bedrock(converse_handler())
+    
+    first = asyncio.run(provider.achat(MESSAGES))
+    second = asyncio.run(provider.achat(MESSAGES))
+    results = asyncio.run(provider.abatch([MESSAGES, MESSAGES]))
+    
+    assert first.content == second.content == "hi"
+    assert [result.content for result in results] == ["hi", "hi"]
+
+
+def test_aclose_closes_the_async_client_of_the_running_loop(make_bedrock):
+    provider = make_bedrock(converse_handler())
+    
+    async def run():
+        await provider.achat(MESSAGES)
+        client = provider.async_client
+        await provider.aclose()
+        return client
+    
+    assert asyncio.run(run()).is_closed
+    assert provider._async_client is None
+
+
+# Native converse and event-stream path
+
+STREAM_EVENTS = [
+    ("messageStart", {"role": "assistant"}),
+    ("contentBlockDelta", {"contentBlockIndex": 0, "delta": {"text": "Hel"}}),
+    ("contentBlockDelta", {"contentBlockIndex": 0, "delta": {"text": "lo"}}),
+    ("contentBlockStop", {"contentBlockIndex": 0}),
+    ("contentBlockStart", {"contentBlockIndex": 1, "start": {"toolUse": {"toolUseId": "t1", "name": "add"}}}),
+    ("contentBlockDelta", {"contentBlockIndex": 1, "delta": {"toolUse": {"input": '{"a":'}}}),
+    ("contentBlockDelta", {"contentBlockIndex": 1, "delta": {"toolUse": {"input": "1}"}}}),
+    ("contentBlockStop", {"contentBlockIndex": 1}),
+    ("messageStop", {"stopReason": "tool_use"}),
+    ("metadata", {"usage": {"inputTokens": 1, "outputTokens": 2}, "metrics": {}}),
+]
+
+STREAM_BODY = b"".join(converse_event(*event) for event in STREAM_EVENTS)
+
+
+def stream_handler(body: bytes, requests=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(200, content=body)
+    return handler
+
+
+def collect(provider, messages=MESSAGES):
+    async def run():
+        return [chunk async for chunk in provider.achat_stream(messages)]
+    return asyncio.run(run())
+
+
+def test_native_converse_sends_signed_request_and_parses_response(make_bedrock):
+    requests = []
+    provider = make_bedrock(converse_handler(requests), temperature=0.2)
+    
+    result = asyncio.run(provider.achat(MESSAGES, enable_reasoning=True))
+    
+    assert result.content == "hi"
+    assert result.reasoning_content == "think"
+    assert result.tool_calls == [{"id": "t1", "name": "add", "arguments": '{"a":1}'}]
+    request = requests[0]
+    assert request.url == "https://bedrock-runtime.us-east-1.amazonaws.com/model/anthropic.claude-test/converse"
+    assert request.headers["authorization"].startswith("AWS4-HMAC-SHA256 Credential=AKIDTEST/")
+    assert orjson.loads(request.content) == {
+        "messages": [{"role": "user", "content": [{"text": "hi"}]}],
+        "inferenceConfig": {"temperature": 0.2},
+    }
+
+
+def test_native_request_encodes_raw_bytes_as_base64(make_bedrock):
+    requests = []
+    provider = make_bedrock(converse_handler(requests))
+    
+    asyncio.run(provider.achat([{"role": "user", "content": [{"type": "image", "image_bytes": b"\x89PNG", "format": "png"}]}]))
+    
+    image = orjson.loads(requests[0].content)["messages"][0]["content"][0]["image"]
+    assert image == {"format": "png", "source": {"bytes": "iVBORw=="}}
+
+
+def test_native_stream_decodes_events_and_tool_calls(make_bedrock):
+    requests = []
+    provider = make_bedrock(stream_handler(STREAM_BODY, requests))
+    
+    chunks = collect(provider)
+    
+    assert "".join(chunk.delta for chunk in chunks) == "Hello"
+    assert [chunk.tool_calls for chunk in chunks if chunk.tool_calls] == [
+        [{"id": "t1", "name": "add", "arguments_delta": '{"a":'}],
+        [{"id": "t1", "name": "add", "arguments_delta": "1}"}],
+        [{"id": "t1", "name": "add", "arguments": '{"a":1}'}],
+    ]
+    assert chunks[-2].is_complete and chunks[-2].metadata == {"finish_reason": "tool_use"}
+    assert chunks[-1].metadata["usage"] == {"inputTokens": 1, "outputTokens": 2}
+    assert requests[0].url.path.endswith("/converse-stream")
+
+
+def test_native_stream_handles_frames_split_across_chunks(make_bedrock):
+    async def body():
+        for i in range(0, len(STREAM_BODY), 7):
+            yield STREAM_BODY[i:i + 7]
+    
+    def handler(request):
+        return httpx.Response(200, content=body())
+    
+    assert "".join(chunk.delta for chunk in collect(make_bedrock(handler))) == "Hello"
+
+
+def test_native_stream_raises_on_exception_frame(make_bedrock):
+    body = converse_event(*STREAM_EVENTS[0]) + event_stream_frame(
+        {":message-type": "exception", ":exception-type": "throttlingException"},
+        b'{"message": "slow down"}'
+    )
+    
+    with pytest.raises(ProviderError, match=r"\[throttlingException\]: slow down"):
+        collect(make_bedrock(stream_handler(body)))
+
+
+def test_native_stream_raises_on_error_frame(make_bedrock):
+    body = converse_event(*STREAM_EVENTS[0]) + event_stream_frame(
+        {":message-type": "error", ":error-code": "InternalFailure", ":error-message": "boom"}
+    )
+    
+    with pytest.raises(ProviderError, match=r"\[InternalFailure\]: boom"):
+        collect(make_bedrock(stream_handler(body)))
+
+
+def test_native_stream_raises_on_error_status(make_bedrock):
+    def handler(request):
+        return httpx.Response(
+            400, json={"message": "bad input"}, headers={"x-amzn-errortype": "ValidationException:http://x"}
+        )
+    
+    with pytest.raises(ProviderError) as excinfo:
+        collect(make_bedrock(handler))
+    
+    assert excinfo.value.status_code == 400
+    assert str(excinfo.value) == "Bedrock streaming API error [ValidationException]: bad input"
+
+
+@pytest.mark.parametrize("body", [b'["not", "a", "dict"]', b'"text"', b"<html>bad gateway</html>"])
+def test_http_error_handles_non_object_bodies(body):
+    error = Bedrock._http_error(httpx.Response(400, content=body, headers={"x-amzn-errortype": "ValidationException:x"}))
+    
+    assert error.status_code == 400
+    assert str(error) == f"Bedrock API error [ValidationException]: {body.decode()}"
+
+
+# Retries and batching
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    delays = []
+    
+    def fake_retry_delay(attempt, backoff_base, backoff_max, retry_after=None):
+        delays.append((attempt, retry_after))
+        return 0
+    
+    monkeypatch.setattr(bedrock_module, "retry_delay", fake_retry_delay)
+    return delays
+
+
+def test_native_path_retries_throttling_then_succeeds(make_bedrock, no_backoff):
+    responses = [
+        httpx.Response(429, json={"message": "slow down"}, headers={"Retry-After": "2"}),
+        httpx.Response(503),
+    ]
+    
+    def handler(request):
+        return responses.pop(0) if responses else httpx.Response(200, json=CONVERSE_RESPONSE)
+    
+    result = asyncio.run(make_bedrock(handler).achat(MESSAGES))
+    
+    assert result.content == "hi"
+    assert no_backoff == [(0, "2"), (1, None)]
+
+
+def test_native_path_does_not_retry_after_request_was_sent(make_bedrock, no_backoff):
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        raise httpx.ReadTimeout("slow")
+    
+    with pytest.raises(ProviderError):
+        asyncio.run(make_bedrock(handler).achat(MESSAGES))
+    
+    assert len(calls) == 1
+    assert no_backoff == []
+
+
+def test_native_path_raises_status_once_retries_are_exhausted(make_bedrock, no_backoff):
+    provider = make_bedrock(lambda request: httpx.Response(429, json={"message": "slow down"}), max_retries=1)
+    
+    with pytest.raises(ProviderError) as excinfo:
+        asyncio.run(provider.achat(MESSAGES))
+    
+    assert excinfo.value.status_code == 429
+    assert len(no_backoff) == 1
+
+
+class FakeBedrockClient:
+    """Stand-in for an injected boto3 bedrock-runtime client."""
+    
+    def __init__(self, failures=0):
+        self.calls = 0
+        self.failures = failures
+    
+    def converse(self, **request):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("throttled")
+        return CONVERSE_RESPONSE
+
+
+def test_injected_client_runs_in_threads_and_leaves_retries_to_boto(no_backoff):
+    client = FakeBedrockClient(failures=1)
+    provider = Bedrock("anthropic.claude-test", bedrock_client=client)
+    
+    results = asyncio.run(provider.abatch([MESSAGES, MESSAGES]))
+    
+    assert isinstance(results[0], ProviderError)
+    assert results[1].content == "hi"
+    assert client.calls == 2
+    assert no_backoff == []
+
+
+def test_abatch_keeps_order_and_caps_requests_in_flight(make_bedrock):
+    in_flight = []
+    peak = []
+    
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        text = orjson.loads(request.content)["messages"][0]["content"][0]["text"]
+        return httpx.Response(200, json={"output": {"message": {"content": [{"text": text}]}}})
+    
+    batch = [[{"role": "user", "content": f"q{i}"}] for i in range(6)]
+    results = asyncio.run(make_bedrock(handler).abatch(batch, max_at_once=2))
+    
+    assert [result.content for result in results] == [f"q{i}" for i in range(6)]
+    assert max(peak) == 2
+
+
+# Shared boto3 clients
+
+@pytest.fixture
+def fake_sessions(monkeypatch):
+    """Replace boto3.Session with a recorder and start from an empty client cache."""
+    import boto3
+    
+    sessions = []
+    
+    class FakeSession:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            sessions.append(self)
+        
+        def client(self, service_name, region_name=None):
+            return (service_name, region_name, self)
+    
+    monkeypatch.setattr(boto3, "Session", FakeSession)
+    monkeypatch.setattr(bedrock_module, "_CLIENT_CACHE", {})
+    return sessions
+
+
+def test_profile_clients_are_shared_per_region_and_profile(fake_sessions):
+    first = Bedrock("m", region_name="us-east-1", aws_profile="dev").client
+    second = Bedrock("m", region_name="us-east-1", aws_profile="dev").client
+    other_region = Bedrock("m", region_name="us-west-2", aws_profile="dev").client
+    default_chain = Bedrock("m", region_name="us-east-1").client
+    
+    assert second is first
+    assert other_region is not first and default_chain is not first
+    assert [session.kwargs for session in fake_sessions] == [
+        {"profile_name": "dev"}, {"profile_name": "dev"}, {"profile_name": None}
+    ]
+
+
+def test_cached_clients_are_created_once_under_concurrency(fake_sessions):
+    barrier = threading.Barrier(8)
+    clients = []
+    
+    def build():
+        barrier.wait()
+        clients.append(Bedrock("m", region_name="eu-west-1").client)
+    
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(fake_sessions) == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_explicit_credentials_are_not_cached_process_wide(fake_sessions):
+    first = Bedrock("m", aws_access_key_id="AK", aws_secret_access_key="SK").client
+    second = Bedrock("m", aws_access_key_id="AK", aws_secret_access_key="SK").client
+    
+    assert first is not second
+    assert bedrock_module._CLIENT_CACHE == {}
+    assert fake_sessions[0].kwargs["aws_access_key_id"] == "AK"
+
+
+def test_injected_client_takes_precedence(fake_sessions):
+    client = FakeBedrockClient()
+    
+    assert Bedrock("m", bedrock_client=client, aws_profile="dev").client is client
+    assert fake_sessions == []
+
+
+# Stream state
+
+def text_delta(text, index=0):
+    return {"contentBlockDelta": {"contentBlockIndex": index, "delta": {"text": text}}}
+
+
+def tool_start(index, tool_use_id="t1", name="add"):
+    return {"contentBlockStart": {"contentBlockIndex": index, "start": {"toolUse": {"toolUseId": tool_use_id, "name": name}}}}
+
+
+def tool_delta(index, fragment):
+    return {"contentBlockDelta": {"contentBlockIndex": index, "delta": {"toolUse": {"input": fragment}}}}
+
+
+def block_stop(index):
+    return {"contentBlockStop": {"contentBlockIndex": index}}
+
+
+def test_stream_state_labels_tool_deltas_with_id_and_name():
+    state = _BedrockStreamState()
+    
+    state.annotate(tool_start(1))
+    event = state.annotate(tool_delta(1, '{"a":'))
+    
+    assert event["contentBlockDelta"]["delta"]["toolUse"] == {"input": '{"a":', "toolUseId": "t1", "name": "add"}
+
+
+def test_stream_state_tracks_interleaved_tool_blocks_separately():
+    state = _BedrockStreamState()
+    
+    state.annotate(tool_start(0, "a", "first"))
+    state.annotate(tool_start(1, "b", "second"))
+    second = state.annotate(tool_delta(1, '{"y":2}'))
+    first = state.annotate(tool_delta(0, '{"x":1}'))
+    
+    assert first["contentBlockDelta"]["delta"]["toolUse"]["toolUseId"] == "a"
+    assert second["contentBlockDelta"]["delta"]["toolUse"]["name"] == "second"
+
+
+def test_stream_states_are_independent_per_stream():
+    first, second = _BedrockStreamState(), _BedrockStreamState()
+    
+    first.annotate(tool_start(0, "a", "first"))
+    event = second.annotate(tool_delta(0, "{}"))
+    
+    assert event["contentBlockDelta"]["delta"]["toolUse"]["toolUseId"] is None
+
+
+def test_stream_state_joins_tool_input_on_block_stop():
+    state = _BedrockStreamState()
+    
+    state.annotate(tool_start(0, "a", "first"))
+    state.annotate(tool_start(1, "b", "second"))
+    for event in (tool_delta(0, '{"x":'), tool_delta(1, '{"y":2}'), tool_delta(0, "1}")):
+        state.annotate(event)
+    
+    assert state.annotate(block_stop(0))["contentBlockStop"]["toolUse"] == {"toolUseId": "a", "name": "first", "input": '{"x":1}'}
+    assert state.annotate(block_stop(1))["contentBlockStop"]["toolUse"] == {"toolUseId": "b", "name": "second", "input": '{"y":2}'}
+    assert state.tool_calls == {} and state.tool_args == {}
+
+
+def test_stream_state_defaults_empty_input_and_ignores_text_blocks():
+    state = _BedrockStreamState()
+    
+    state.annotate(tool_start(0))
+    assert state.annotate(block_stop(0))["contentBlockStop"]["toolUse"]["input"] == "{}"
+    
+    state.annotate(text_delta("hello", index=1))
+    assert "toolUse" not in state.annotate(block_stop(1))["contentBlockStop"]
+
+
+def test_boto_stream_path_emits_complete_tool_call():
+    class StreamingClient:
+        def converse_stream(self, **request):
+            return {"stream": [{event_type: payload} for event_type, payload in STREAM_EVENTS]}
+    
+    provider = Bedrock("anthropic.claude-test", bedrock_client=StreamingClient())
+    
+    chunks = list(provider.chat_stream(MESSAGES))
+    
+    complete = [call for chunk in chunks for call in chunk.tool_calls or () if "arguments" in call]
+    assert complete == [{"id": "t1", "name": "add", "arguments": '{"a":1}'}]
+
+
+# Delta coalescing
+
+def drive(coalescer, events):
+    out = []
+    for event in events:
+        out.extend(coalescer.push(event))
+    out.extend(coalescer.flush())
+    return out
+
+
+def test_coalescer_merges_runs_up_to_max_events():
+    out = drive(_StreamCoalescer(max_events=2), [text_delta("a"), text_delta("b"), text_delta("c")])
+    
+    assert out == [text_delta("ab"), text_delta("c")]
+
+
+def test_coalescer_preserves_order_around_other_events():
+    events = [text_delta("a"), text_delta("b"), block_stop(0), text_delta("c", index=1)]
+    
+    assert drive(_StreamCoalescer(max_events=10), events) == [text_delta("ab"), block_stop(0), text_delta("c", index=1)]
+
+
+def test_coalescer_does_not_merge_across_blocks_or_kinds():
+    events = [text_delta("a", index=0), text_delta("b", index=1), tool_delta(1, "{}")]
+    
+    assert drive(_StreamCoalescer(max_events=10), events) == events
+
+
+def test_coalescer_merges_tool_input_keeping_tool_identity():
+    state = _BedrockStreamState()
+    events = [state.annotate(event) for event in (tool_start(0), tool_delta(0, '{"a":'), tool_delta(0, "1}"))]
+    
+    out = drive(_StreamCoalescer(max_events=10), events)
+    
+    assert out[1]["contentBlockDelta"]["delta"]["toolUse"] == {"input": '{"a":1}', "toolUseId": "t1", "name": "add"}
+
+
+def test_coalescer_merges_reasoning_text_only():
+    def reasoning(**delta):
+        return {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"reasoningContent": delta}}}
+    
+    assert drive(_StreamCoalescer(max_events=10), [reasoning(text="x"), reasoning(text="y")]) == [reasoning(text="xy")]
+    signed = [reasoning(text="x"), reasoning(signature="sig")]
+    assert drive(_StreamCoalescer(max_events=10), signed) == signed
+
+
+def test_coalescer_window_is_checked_when_events_arrive(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(bedrock_module.time, "monotonic", lambda: now[0])
+    coalescer = _StreamCoalescer(max_events=10, window_ms=50)
+    
+    assert coalescer.push(text_delta("a")) == []
+    now[0] = 0.04
+    assert coalescer.push(text_delta("b")) == []
+    # No timer: text stays buffered until the next event arrives
+    now[0] = 0.5
+    assert coalescer.push(text_delta("c")) == [text_delta("ab")]
+    assert coalescer.flush() == [text_delta("c")]
+
+
+def test_native_stream_coalesces_deltas(make_bedrock):
+    provider = make_bedrock(stream_handler(STREAM_BODY), stream_buffer_size=8)
+    
+    chunks = collect(provider)
+    
+    assert [chunk.delta for chunk in chunks if chunk.delta] == ["Hello"]
+    assert [chunk.tool_calls for chunk in chunks if chunk.tool_calls][0] == [
+        {"id": "t1", "name": "add", "arguments_delta": '{"a":1}'}
+    ]
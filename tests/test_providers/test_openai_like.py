@@ -0,0 +1,728 @@
+"""Tests for the OpenAI-compatible provider."""
+
+import asyncio
+import base64
+
+import httpx
+import orjson
+import pytest
+
+from unified_llm import OpenAILike, ProviderError
+from unified_llm.providers.openai_like import provider as openai_like_module
+from unified_llm.providers.openai_like.provider import _SSEParser, _iter_sse_data, _sniff_image_format
+
+from helpers import completion, sse_body, stream_chunk
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def failing_then_ok(*failures):
+    """Handler that plays back the given failures (responses or exceptions), then succeeds."""
+    calls = []
+    remaining = list(failures)
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if remaining:
+            failure = remaining.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return httpx.Response(200, json=completion("done"))
+    
+    return handler, calls
+
+
+def test_retries_transient_status_then_succeeds(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(httpx.Response(503), httpx.Response(502))
+    provider = make_openai_like(handler)
+    
+    response = provider.chat(MESSAGES)
+    
+    assert response.content == "done"
+    assert len(calls) == 3
+    assert [attempt for attempt, _ in retry_delays] == [0, 1]
+
+
+def test_passes_retry_after_header_to_backoff(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(httpx.Response(429, headers={"Retry-After": "7"}))
+    provider = make_openai_like(handler)
+    
+    provider.chat(MESSAGES)
+    
+    assert retry_delays == [(0, "7")]
+
+
+def test_raises_status_code_once_retries_are_exhausted(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(*[httpx.Response(503, json={"error": {"message": "busy"}})] * 10)
+    provider = make_openai_like(handler, max_retries=2)
+    
+    with pytest.raises(ProviderError) as excinfo:
+        provider.chat(MESSAGES)
+    
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.provider == "openai_like"
+    assert "busy" in str(excinfo.value)
+    assert len(calls) == 3
+
+
+def test_does_not_retry_client_errors(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(httpx.Response(400, json={"error": {"message": "bad"}}))
+    provider = make_openai_like(handler)
+    
+    with pytest.raises(ProviderError) as excinfo:
+        provider.chat(MESSAGES)
+    
+    assert excinfo.value.status_code == 400
+    assert len(calls) == 1
+    assert retry_delays == []
+
+
+def test_auth_errors_stay_provider_errors(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(httpx.Response(401, json={"error": {"message": "bad key"}}))
+    provider = make_openai_like(handler)
+    
+    with pytest.raises(ProviderError) as excinfo:
+        provider.chat(MESSAGES)
+    
+    assert excinfo.value.status_code == 401
+    assert "test-model" in str(excinfo.value)
+
+
+def test_retries_connection_failures(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(httpx.ConnectError("refused"))
+    provider = make_openai_like(handler)
+    
+    assert provider.chat(MESSAGES).content == "done"
+    assert len(calls) == 2
+
+
+def test_does_not_retry_after_request_was_sent(make_openai_like, retry_delays):
+    # The server may already be generating the completion; retrying could bill it twice
+    handler, calls = failing_then_ok(httpx.ReadTimeout("slow"))
+    provider = make_openai_like(handler)
+    
+    with pytest.raises(ProviderError):
+        provider.chat(MESSAGES)
+    
+    assert len(calls) == 1
+    assert retry_delays == []
+
+
+def test_max_retries_zero_disables_retries(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(httpx.Response(503))
+    provider = make_openai_like(handler, max_retries=0)
+    
+    with pytest.raises(ProviderError) as excinfo:
+        provider.chat(MESSAGES)
+    
+    assert excinfo.value.status_code == 503
+    assert len(calls) == 1
+
+
+def test_async_retries_then_succeeds(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(httpx.Response(429), httpx.ConnectError("refused"))
+    provider = make_openai_like(handler)
+    
+    response = asyncio.run(provider.achat(MESSAGES))
+    
+    assert response.content == "done"
+    assert len(calls) == 3
+
+
+def test_async_raises_status_code_once_retries_are_exhausted(make_openai_like, retry_delays):
+    handler, calls = failing_then_ok(*[httpx.Response(500)] * 10)
+    provider = make_openai_like(handler, max_retries=1)
+    
+    with pytest.raises(ProviderError) as excinfo:
+        asyncio.run(provider.achat(MESSAGES))
+    
+    assert excinfo.value.status_code == 500
+    assert len(calls) == 2
+
+
+# SSE framing
+
+def split(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 7, 1000])
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n"])
+def test_sse_payloads_survive_arbitrary_chunk_boundaries(size, newline):
+    body = sse_body({"n": 1}, {"n": 2}, newline=newline)
+    
+    assert list(_iter_sse_data(split(body, size))) == [b'{"n":1}', b'{"n":2}']
+
+
+def test_sse_stops_at_done_and_ignores_trailing_data():
+    body = b'data: {"n":1}\n\ndata: [DONE]\n\ndata: {"n":2}\n\n'
+    
+    assert list(_iter_sse_data([body])) == [b'{"n":1}']
+
+
+def test_sse_flushes_last_payload_without_trailing_newline():
+    assert list(_iter_sse_data([b'data: {"n":1}\n\ndata: {"n":2}'])) == [b'{"n":1}', b'{"n":2}']
+    assert list(_iter_sse_data([b'data: {"n":1}\r'])) == [b'{"n":1}']
+    assert list(_iter_sse_data([b'data: [DONE]'])) == []
+
+
+def test_sse_skips_comments_and_other_fields():
+    body = b': keep-alive\n\nevent: message\nid: 3\ndata: {"n":1}\n\n'
+    
+    assert list(_iter_sse_data([body])) == [b'{"n":1}']
+
+
+def test_sse_accepts_data_field_without_space():
+    # The SSE spec makes the space after the colon optional
+    assert list(_iter_sse_data([b'data:{"n":1}\n\ndata:  {"n":2}\n\ndata:[DONE]\n\n'])) == [b'{"n":1}', b' {"n":2}']
+    assert list(_iter_sse_data([b'data:{"n":3}'])) == [b'{"n":3}']
+
+
+def test_sse_parser_marks_done():
+    parser = _SSEParser()
+    
+    assert parser.feed(b'data: {"n":1}\n\ndata: [DO') == [b'{"n":1}']
+    assert not parser.done
+    assert parser.feed(b'NE]\n\n') == []
+    assert parser.done
+    assert parser.flush() == []
+
+
+def stream_handler(body: bytes):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body)
+    return handler
+
+
+STREAM_BODY = sse_body(
+    stream_chunk("Hel"),
+    stream_chunk("lo"),
+    stream_chunk("", finish_reason="stop"),
+    {"model": "test-model", "choices": [], "usage": {"total_tokens": 3}},
+    newline=b"\r\n"
+)
+
+
+def test_chat_stream_decodes_sse_response(make_openai_like):
+    provider = make_openai_like(stream_handler(STREAM_BODY))
+    
+    chunks = list(provider.chat_stream(MESSAGES))
+    
+    assert "".join(chunk.delta for chunk in chunks) == "Hello"
+    assert [chunk.is_complete for chunk in chunks] == [False, False, True, False]
+    assert chunks[-1].metadata["usage"] == {"total_tokens": 3}
+
+
+# Exact-match response cache
+
+def counting_handler():
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json=completion(f"answer {len(calls)}"))
+    
+    return handler, calls
+
+
+def test_cache_serves_repeated_deterministic_requests(make_openai_like):
+    handler, calls = counting_handler()
+    provider = make_openai_like(handler, cache_enabled=True, temperature=0)
+    
+    first = provider.chat(MESSAGES)
+    second = provider.chat([{"content": "hi", "role": "user"}])  # key order must not matter
+    
+    assert first.content == second.content == "answer 1"
+    assert len(calls) == 1
+
+
+def test_cache_skips_sampled_requests(make_openai_like):
+    handler, calls = counting_handler()
+    provider = make_openai_like(handler, cache_enabled=True, temperature=0.7)
+    
+    provider.chat(MESSAGES)
+    provider.chat(MESSAGES)
+    
+    assert len(calls) == 2
+
+
+def test_cache_is_off_by_default_and_bypassable(make_openai_like):
+    handler, calls = counting_handler()
+    default = make_openai_like(handler, temperature=0)
+    default.chat(MESSAGES)
+    default.chat(MESSAGES)
+    
+    cached = make_openai_like(handler, cache_enabled=True, temperature=0)
+    cached.chat(MESSAGES)
+    cached.chat(MESSAGES, cache=False)
+    
+    assert len(calls) == 4
+
+
+def test_cache_evicts_least_recently_used_and_clears(make_openai_like):
+    handler, calls = counting_handler()
+    provider = make_openai_like(handler, cache_enabled=True, temperature=0, cache_size=1)
+    other = [{"role": "user", "content": "other"}]
+    
+    provider.chat(MESSAGES)
+    provider.chat(other)
+    provider.chat(MESSAGES)
+    assert len(calls) == 3
+    
+    provider.chat(MESSAGES)
+    assert len(calls) == 3
+    
+    provider.clear_cache()
+    provider.chat(MESSAGES)
+    assert len(calls) == 4
+
+
+class FakeSemanticCache:
+    """Semantic cache stand-in keyed on the last message's text."""
+    
+    def __init__(self):
+        self.entries = {}
+    
+    def lookup(self, messages):
+        return self.entries.get(messages[-1]["content"])
+    
+    def store(self, messages, response):
+        self.entries[messages[-1]["content"]] = response
+
+
+def test_semantic_cache_is_consulted_for_any_temperature(make_openai_like):
+    handler, calls = counting_handler()
+    semantic_cache = FakeSemanticCache()
+    provider = make_openai_like(handler, semantic_cache=semantic_cache, temperature=0.9)
+    
+    provider.chat(MESSAGES)
+    response = provider.chat(MESSAGES)
+    
+    assert response.content == "answer 1"
+    assert len(calls) == 1
+    assert "hi" in semantic_cache.entries
+
+
+# Batch requests
+
+def echo_handler(fail=()):
+    """Answer each request with its last user message; fail those listed."""
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        question = orjson.loads(request.content)["messages"][-1]["content"]
+        calls.append(question)
+        if question in fail:
+            return httpx.Response(400, json={"error": {"message": "rejected"}})
+        return httpx.Response(200, json=completion(f"re: {question}"))
+    
+    return handler, calls
+
+
+def batch_of(n):
+    return [[{"role": "user", "content": f"q{i}"}] for i in range(n)]
+
+
+def test_batch_keeps_input_order_and_returns_failures_in_place(make_openai_like):
+    handler, calls = echo_handler(fail={"q1"})
+    provider = make_openai_like(handler)
+    
+    results = asyncio.run(provider.achat_batch(batch_of(3)))
+    
+    assert results[0].content == "re: q0"
+    assert isinstance(results[1], ProviderError)
+    assert results[2].content == "re: q2"
+
+
+def test_batch_raises_first_failure_without_return_exceptions(make_openai_like):
+    handler, calls = echo_handler(fail={"q1"})
+    provider = make_openai_like(handler)
+    
+    with pytest.raises(ProviderError):
+        asyncio.run(provider.achat_batch(batch_of(3), return_exceptions=False))
+
+
+def test_batch_caps_requests_in_flight(make_openai_like):
+    in_flight = []
+    peak = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        return httpx.Response(200, json=completion())
+    
+    provider = make_openai_like(handler)
+    
+    results = asyncio.run(provider.achat_batch(batch_of(8), max_concurrency=3))
+    
+    assert len(results) == 8
+    assert max(peak) == 3
+
+
+def test_batch_reports_progress(make_openai_like):
+    handler, calls = echo_handler(fail={"q1"})
+    provider = make_openai_like(handler)
+    progress = []
+    
+    asyncio.run(provider.achat_batch(
+        batch_of(3), max_concurrency=1, on_progress=lambda done, total: progress.append((done, total))
+    ))
+    
+    assert progress == [(1, 3), (2, 3)]
+
+
+def test_batch_resumes_from_checkpoint(make_openai_like, tmp_path):
+    checkpoint = tmp_path / "batch.jsonl"
+    handler, calls = echo_handler(fail={"q1"})
+    asyncio.run(make_openai_like(handler).achat_batch(batch_of(3), output_jsonl=str(checkpoint)))
+    assert len(checkpoint.read_bytes().splitlines()) == 2
+    
+    # An interrupted run can leave a partially written last line
+    with open(checkpoint, "ab") as f:
+        f.write(b'{"index": 1, "resp')
+    
+    handler, calls = echo_handler()
+    results = asyncio.run(make_openai_like(handler).achat_batch(batch_of(3), output_jsonl=str(checkpoint)))
+    
+    assert calls == ["q1"]
+    assert [result.content for result in results] == ["re: q0", "re: q1", "re: q2"]
+    
+    # The recovered item was recorded on a line of its own
+    handler, calls = echo_handler()
+    asyncio.run(make_openai_like(handler).achat_batch(batch_of(3), output_jsonl=str(checkpoint)))
+    assert calls == []
+
+
+def test_batch_rate_limit_spaces_request_starts(make_openai_like, monkeypatch):
+    acquired = []
+    
+    class FakeRateLimiter:
+        def __init__(self, rate, per=1.0):
+            acquired.append((rate, per))
+        
+        async def acquire(self):
+            acquired.append("acquire")
+    
+    monkeypatch.setattr(openai_like_module, "RateLimiter", FakeRateLimiter)
+    handler, calls = echo_handler()
+    
+    asyncio.run(make_openai_like(handler).achat_batch(batch_of(2), rate_limit_qpm=120))
+    
+    assert acquired == [(120, 60.0), "acquire", "acquire"]
+
+
+# Request template
+
+def recording_handler():
+    bodies = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(orjson.loads(request.content))
+        return httpx.Response(200, json=completion())
+    
+    return handler, bodies
+
+
+def test_parameter_edits_apply_to_the_next_call(make_openai_like):
+    handler, bodies = recording_handler()
+    provider = make_openai_like(handler, temperature=0.2, top_k=40)
+    
+    provider.chat(MESSAGES)
+    provider.common_params["temperature"] = 0.9
+    provider.provider_params["min_p"] = 0.1
+    provider.chat(MESSAGES)
+    provider.common_params = {"max_tokens": 5}
+    provider.provider_params = {}
+    provider.chat(MESSAGES)
+    
+    assert (bodies[0]["temperature"], bodies[0]["top_k"]) == (0.2, 40)
+    assert (bodies[1]["temperature"], bodies[1]["min_p"]) == (0.9, 0.1)
+    assert bodies[2] == {"model": "test-model", "max_tokens": 5, "messages": MESSAGES, "stream": False}
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers.
+    
+    Args:
+        a: First number
+        b: Second number
+    """
+    return a + b
+
+
+def test_spliced_body_matches_a_full_encode(make_openai_like):
+    provider = make_openai_like(lambda request: httpx.Response(200, json=completion()), tools=[add], seed=7)
+    request = provider._prepare_request(MESSAGES, stream=True)
+    
+    body = provider._encode_request(request)
+    
+    assert orjson.loads(body) == orjson.loads(orjson.dumps(request))
+    assert orjson.loads(body)["tools"][0]["function"]["name"] == "add"
+
+
+def test_replaced_static_field_falls_back_to_full_encode(make_openai_like):
+    provider = make_openai_like(lambda request: httpx.Response(200, json=completion()))
+    request = provider._prepare_request(MESSAGES)
+    request["temperature"] = 0.0
+    
+    assert orjson.loads(provider._encode_request(request))["temperature"] == 0.0
+
+
+# Multimodal message conversion
+
+PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAE="
+
+
+def test_multimodal_blocks_convert_to_openai_parts(make_openai_like):
+    handler, bodies = recording_handler()
+    provider = make_openai_like(handler)
+    messages = [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": [
+            {"type": "text", "text": "what is this?"},
+            {"type": "image", "image_data": PNG_B64},
+        ]},
+    ]
+    
+    provider.chat(messages)
+    
+    sent = bodies[0]["messages"]
+    assert sent[0] == messages[0]
+    assert sent[1]["content"] == [
+        {"type": "text", "text": "what is this?"},
+        {"type": "image_url", "image_url": {"url": "data:image/png;base64," + PNG_B64}},
+    ]
+    assert messages[1]["content"][1] == {"type": "image", "image_data": PNG_B64}
+
+
+def test_messages_edited_in_place_are_converted_again(make_openai_like):
+    handler, bodies = recording_handler()
+    provider = make_openai_like(handler)
+    message = {"role": "user", "content": [{"type": "image", "image_data": PNG_B64}]}
+    
+    provider.chat([message])
+    message["content"][0]["image_data"] = "R0lGODlhAQABAAAAACw="
+    provider.chat([message])
+    
+    urls = [body["messages"][0]["content"][0]["image_url"]["url"] for body in bodies]
+    assert urls == ["data:image/png;base64," + PNG_B64, "data:image/gif;base64,R0lGODlhAQABAAAAACw="]
+
+
+# Shared client pool
+
+def test_providers_for_one_endpoint_share_a_refcounted_client():
+    first = OpenAILike("a", base_url="http://pool.local", api_key="k1")
+    second = OpenAILike("b", base_url="http://pool.local/v1/", api_key="k1")
+    other_key = OpenAILike("c", base_url="http://pool.local", api_key="k2")
+    shared = first.client
+    
+    assert second.client is shared
+    assert other_key.client is not shared
+    
+    first.close()
+    first.close()  # idempotent: must not drop the second provider's reference
+    assert not shared.is_closed
+    
+    second.close()
+    assert shared.is_closed
+    
+    other_key.close()
+    assert other_key.client.is_closed
+
+
+def test_pool_hands_out_a_fresh_client_after_the_last_release():
+    with OpenAILike("a", base_url="http://pool.local", api_key="k3") as provider:
+        closed = provider.client
+    
+    with OpenAILike("a", base_url="http://pool.local", api_key="k3") as provider:
+        assert provider.client is not closed
+        assert not provider.client.is_closed
+
+
+def test_pool_key_does_not_hold_the_raw_api_key():
+    with OpenAILike("a", base_url="http://pool.local", api_key="sk-secret") as provider:
+        assert "sk-secret" not in repr(provider._client_key)
+
+
+# Async client lifecycle
+
+def test_async_calls_work_across_event_loops(make_openai_like):
+    handler, calls = echo_handler()
+    provider = make_openai_like(handler)
+    
+    first = asyncio.run(provider.achat(MESSAGES))
+    second = asyncio.run(provider.achat(MESSAGES))
+    results = asyncio.run(provider.achat_batch(batch_of(2)))
+    
+    assert first.content == second.content == "re: hi"
+    assert [result.content for result in results] == ["re: q0", "re: q1"]
+
+
+def test_async_client_is_reused_within_a_loop(make_openai_like):
+    provider = make_openai_like(echo_handler()[0])
+    
+    async def clients():
+        return provider.async_client, provider.async_client
+    
+    first, again = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+    
+    assert first is again
+    assert second is not first
+
+
+def test_aclose_closes_the_async_client_of_the_running_loop(make_openai_like):
+    provider = make_openai_like(echo_handler()[0])
+    
+    async def run():
+        await provider.achat(MESSAGES)
+        client = provider.async_client
+        await provider.aclose()
+        return client
+    
+    assert asyncio.run(run()).is_closed
+    assert provider._async_client is None
+
+
+def test_achat_stream_decodes_sse_response(make_openai_like):
+    provider = make_openai_like(stream_handler(STREAM_BODY))
+    
+    async def collect():
+        return [chunk async for chunk in provider.achat_stream(MESSAGES)]
+    
+    assert "".join(chunk.delta for chunk in asyncio.run(collect())) == "Hello"
+    assert "".join(chunk.delta for chunk in asyncio.run(collect())) == "Hello"
+
+
+# Tagged reasoning in streams
+
+THINKING_BODY = sse_body(
+    stream_chunk("<think>"), stream_chunk("plan"), stream_chunk("</think>"), stream_chunk("answer")
+)
+PLAIN_BODY = sse_body(stream_chunk("one"), stream_chunk("two"), stream_chunk("three"), stream_chunk("four"))
+
+
+def by_question_handler(request: httpx.Request) -> httpx.Response:
+    question = orjson.loads(request.content)["messages"][-1]["content"]
+    return httpx.Response(200, content=THINKING_BODY if question == "think" else PLAIN_BODY)
+
+
+def test_stream_routes_tagged_reasoning_across_chunks(make_openai_like):
+    provider = make_openai_like(by_question_handler)
+    
+    chunks = list(provider.chat_stream([{"role": "user", "content": "think"}], enable_reasoning=True))
+    
+    assert "".join(chunk.reasoning_delta or "" for chunk in chunks) == "<think>plan"
+    assert [chunk.delta for chunk in chunks] == ["", "", "</think>", "answer"]
+    assert [chunk.is_reasoning_complete for chunk in chunks] == [False, False, True, False]
+
+
+def test_interleaved_streams_keep_separate_reasoning_state(make_openai_like):
+    provider = make_openai_like(by_question_handler)
+    thinking = provider.chat_stream([{"role": "user", "content": "think"}], enable_reasoning=True)
+    plain = provider.chat_stream([{"role": "user", "content": "plain"}], enable_reasoning=True)
+    
+    first = next(thinking)  # opens <think> in the first stream only
+    deltas = [next(plain).delta, next(thinking).delta, next(plain).delta]
+    
+    assert first.reasoning_delta == "<think>"
+    assert deltas == ["one", "", "two"]
+
+
+def test_concurrent_async_streams_keep_separate_reasoning_state(make_openai_like):
+    provider = make_openai_like(by_question_handler)
+    
+    async def collect(question):
+        chunks = []
+        async for chunk in provider.achat_stream([{"role": "user", "content": question}], enable_reasoning=True):
+            chunks.append(chunk)
+            await asyncio.sleep(0)
+        return chunks
+    
+    async def both():
+        return await asyncio.gather(collect("think"), collect("plain"))
+    
+    thinking, plain = asyncio.run(both())
+    
+    assert "".join(chunk.delta for chunk in plain) == "onetwothreefour"
+    assert "".join(chunk.delta for chunk in thinking) == "</think>answer"
+
+
+def test_stream_metadata_includes_raw_chunk_only_on_request(make_openai_like):
+    default = make_openai_like(stream_handler(STREAM_BODY))
+    opted_in = make_openai_like(stream_handler(STREAM_BODY), include_raw_chunk=True)
+    
+    assert all("raw_chunk" not in chunk.metadata for chunk in default.chat_stream(MESSAGES))
+    raw_chunks = [chunk.metadata["raw_chunk"] for chunk in opted_in.chat_stream(MESSAGES)]
+    assert raw_chunks[0] == stream_chunk("Hel")
+
+
+# Error details
+
+@pytest.mark.parametrize("body, detail", [
+    (b'{"error": {"message": "model overloaded"}}', "model overloaded"),
+    (b'{"error": "flat string"}', '{"error": "flat string"}'),
+    (b'{"error": {"message": ""}}', '{"error": {"message": ""}}'),
+    (b"<html>bad gateway</html>", "<html>bad gateway</html>"),
+])
+def test_error_detail_prefers_api_message_over_raw_body(make_openai_like, body, detail):
+    provider = make_openai_like(lambda request: httpx.Response(400, content=body))
+    
+    with pytest.raises(ProviderError) as excinfo:
+        provider.chat(MESSAGES)
+    
+    assert str(excinfo.value).endswith(f"API request failed: {detail}")
+
+
+def test_stream_error_status_raises_provider_error(make_openai_like):
+    provider = make_openai_like(lambda request: httpx.Response(500, json={"error": {"message": "down"}}))
+    
+    with pytest.raises(ProviderError) as excinfo:
+        list(provider.chat_stream(MESSAGES))
+    
+    assert excinfo.value.status_code == 500
+    assert "Streaming API request failed: down" in str(excinfo.value)
+
+
+# Image media type detection
+
+@pytest.mark.parametrize("image_bytes, image_format", [
+    (b"\xff\xd8\xff\xe0" + b"\0" * 12, "jpeg"),
+    (b"\x89PNG\r\n\x1a\n" + b"\0" * 8, "png"),
+    (b"GIF89a" + b"\0" * 10, "gif"),
+    (b"RIFF\x10\0\0\0WEBPVP8 ", "webp"),
+    (b"RIFF\x10\0\0\0WAVEfmt ", "jpeg"),  # RIFF alone is not WebP
+    (b"\0" * 16, "jpeg"),
+])
+def test_sniff_image_format_from_bytes_and_base64(image_bytes, image_format):
+    assert _sniff_image_format(image_bytes) == image_format
+    assert _sniff_image_format(base64.b64encode(image_bytes).decode()) == image_format
+
+
+def test_sniff_image_format_tolerates_short_or_invalid_base64():
+    assert _sniff_image_format("iVBORw0K") == "png"
+    assert _sniff_image_format("iVBO") == "jpeg"  # too short to match the signature
+    assert _sniff_image_format("!!not base64!!") == "jpeg"
+    assert _sniff_image_format("") == "jpeg"
+
+
+def test_image_parts_use_explicit_format_and_raw_bytes(make_openai_like):
+    handler, bodies = recording_handler()
+    provider = make_openai_like(handler)
+    content = [
+        {"type": "image", "image_bytes": b"GIF89a", "format": "webp"},
+        {"type": "image", "image_bytes": b"\x89PNG\r\n\x1a\n"},
+        {"type": "image", "image_data": "data:image/png;base64,AAAA"},
+    ]
+    
+    provider.chat([{"role": "user", "content": content}])
+    
+    urls = [part["image_url"]["url"] for part in bodies[0]["messages"][0]["content"]]
+    assert urls == [
+        "data:image/webp;base64," + base64.b64encode(b"GIF89a").decode(),
+        "data:image/png;base64," + base64.b64encode(b"\x89PNG\r\n\x1a\n").decode(),
+        "data:image/png;base64,AAAA",
+    ]
@@ -0,0 +1,104 @@
+"""Tests for ToolExecutor."""
+
+import asyncio
+import threading
+
+from unified_llm import ToolExecutor
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+async def async_echo(text: str) -> str:
+    """Echo text after yielding to the event loop."""
+    await asyncio.sleep(0)
+    return text
+
+
+def boom() -> None:
+    """Always fail."""
+    raise RuntimeError("kaboom")
+
+
+def call(name, arguments="{}", call_id="c1"):
+    return {"id": call_id, "name": name, "arguments": arguments}
+
+
+def test_execute_all_concurrent_overlaps_calls_and_keeps_order():
+    # Both calls must be running at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def wait_for_peer(tag: str) -> str:
+        """Block until the other call arrives."""
+        barrier.wait()
+        return tag
+    
+    executor = ToolExecutor([wait_for_peer])
+    calls = [call("wait_for_peer", '{"tag": "first"}', "c1"), call("wait_for_peer", '{"tag": "second"}', "c2")]
+    
+    results = executor.execute_all_concurrent(calls)
+    
+    assert results == [
+        {"role": "tool", "content": "first", "tool_call_id": "c1"},
+        {"role": "tool", "content": "second", "tool_call_id": "c2"},
+    ]
+
+
+def test_execute_all_concurrent_reports_errors_in_place():
+    executor = ToolExecutor([add, boom])
+    
+    results = executor.execute_all_concurrent([call("boom", call_id="c1"), call("add", '{"a": 1, "b": 2}', "c2")])
+    
+    assert results[0]["content"].startswith("Tool execution error: Function execution failed: kaboom")
+    assert results[1]["content"] == "3"
+
+
+def test_aexecute_awaits_coroutines_and_threads_regular_tools():
+    executor = ToolExecutor([add, async_echo])
+    
+    async def run():
+        return await executor.aexecute(call("async_echo", '{"text": "hi"}')), await executor.aexecute(call("add", '{"a": 2, "b": 3}'))
+    
+    assert asyncio.run(run()) == ("hi", "5")
+
+
+def test_aexecute_matches_execute_error_messages():
+    executor = ToolExecutor([add, boom])
+    bad_calls = [
+        "not a dict",
+        {"id": "c1", "arguments": "{}"},
+        {"name": "add", "arguments": "{}"},
+        call("missing"),
+        call("add", "{not json"),
+        call("add", '{"a": 1}'),
+        call("boom"),
+    ]
+    
+    async def run():
+        return [await executor.aexecute(tool_call) for tool_call in bad_calls]
+    
+    assert asyncio.run(run()) == [executor.execute(tool_call) for tool_call in bad_calls]
+
+
+def test_aexecute_all_runs_coroutine_tools_together():
+    in_flight = []
+    peak = []
+    
+    async def slow(tag: str) -> str:
+        """Record how many calls overlap."""
+        in_flight.append(tag)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(tag)
+        return tag
+    
+    executor = ToolExecutor([slow, add])
+    calls = [call("slow", f'{{"tag": "t{i}"}}', f"c{i}") for i in range(3)] + [call("add", '{"a": 1, "b": 1}', "c3")]
+    
+    results = asyncio.run(executor.aexecute_all(calls))
+    
+    assert [result["content"] for result in results] == ["t0", "t1", "t2", "2"]
+    assert [result["tool_call_id"] for result in results] == ["c0", "c1", "c2", "c3"]
+    assert max(peak) == 3
@@ -0,0 +1,286 @@
+"""Tests for schema extraction, tool-call helpers and message validation."""
+
+import asyncio
+import re
+import threading
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from unified_llm.exceptions import ToolExecutionError, ValidationError
+from unified_llm.utils import (
+    _cached_function_schema,
+    _messages_look_valid,
+    _result_to_str,
+    execute_function_call,
+    extract_function_schema,
+    parse_tool_calls,
+    skip_validation,
+    validate_messages,
+)
+
+
+def get_weather(location: str, days: int = 1) -> str:
+    """Get the weather forecast."""
+    return location
+
+
+# Function schemas
+
+def test_schema_is_built_once_per_function():
+    _cached_function_schema.cache_clear()
+    
+    extract_function_schema(get_weather)
+    extract_function_schema(get_weather)
+    
+    assert _cached_function_schema.cache_info().hits == 1
+
+
+def test_schema_copies_can_be_modified_freely():
+    first = extract_function_schema(get_weather)
+    first["parameters"]["properties"]["location"]["type"] = "integer"
+    first["parameters"]["required"].append("days")
+    
+    second = extract_function_schema(get_weather)
+    
+    assert second["parameters"]["properties"]["location"]["type"] == "string"
+    assert second["parameters"]["required"] == ["location"]
+
+
+def test_unhashable_callables_still_get_a_schema():
+    class Tool(dict):
+        __name__ = "tool"
+        
+        def __call__(self, query: str) -> str:
+            return query
+    
+    schema = extract_function_schema(Tool())
+    
+    assert schema["name"] == "tool"
+    assert schema["parameters"]["properties"]["query"]["type"] == "string"
+
+
+def typed_tool(
+    text: str, count: int, ratio: float, flag: bool, items: list, mapping: dict,
+    numbers: List[int], pairs: Tuple[int, int], tags: Set[str], table: Dict[str, int],
+    optional: Optional[int] = None, untyped=None
+) -> None:
+    """Tool with one parameter per supported annotation."""
+
+
+def test_annotations_map_to_json_schema_types():
+    properties = extract_function_schema(typed_tool)["parameters"]["properties"]
+    
+    assert {name: info["type"] for name, info in properties.items()} == {
+        "text": "string", "count": "integer", "ratio": "number", "flag": "boolean",
+        "items": "array", "mapping": "object", "numbers": "array", "pairs": "array",
+        "tags": "array", "table": "object", "optional": "string", "untyped": "string",
+    }
+
+
+def test_string_annotations_are_resolved():
+    namespace = {}
+    exec(
+        "from __future__ import annotations\n"
+        "def deferred(count: int, names: list[str]) -> str:\n"
+        "    '''Tool defined under PEP 563.'''\n",
+        namespace
+    )
+    
+    properties = extract_function_schema(namespace["deferred"])["parameters"]["properties"]
+    
+    assert properties["count"]["type"] == "integer"
+    assert properties["names"]["type"] == "array"
+
+
+def test_unresolvable_string_annotations_fall_back_to_string():
+    def tool(count: "int", note: "Missing") -> None:
+        """Tool whose annotations cannot all be resolved."""
+    
+    properties = extract_function_schema(tool)["parameters"]["properties"]
+    
+    assert set(properties) == {"count", "note"}
+    assert properties["note"]["type"] == "string"
+
+
+# Tool results
+
+@pytest.mark.parametrize("result, expected", [
+    ("sunny", "sunny"),
+    (None, ""),
+    (b"caf\xc3\xa9", "caf\u00e9"),
+    (b"\xff", "\ufffd"),
+    (42, "42"),
+    (1.5, "1.5"),
+])
+def test_result_to_str_normalizes_scalars(result, expected):
+    assert _result_to_str(result) == expected
+
+
+def test_execute_function_call_stringifies_the_result():
+    def lookup(key: str) -> None:
+        """Return nothing."""
+    
+    assert execute_function_call(lookup, '{"key": "a"}') == ""
+
+
+def test_invalid_json_arguments_raise_tool_execution_error():
+    with pytest.raises(ToolExecutionError, match="Invalid JSON arguments") as excinfo:
+        execute_function_call(get_weather, '{"location": ')
+    
+    assert excinfo.value.tool_name == "get_weather"
+
+
+@pytest.mark.parametrize("result, expected", [
+    ({"temp": 21, "unit": "C"}, '{"temp":21,"unit":"C"}'),
+    ([1, "two", None], '[1,"two",null]'),
+    ((1, 2), "[1,2]"),
+    ({1: "one"}, '{"1":"one"}'),
+    ({"when": Decimal("1.5")}, '{"when":"1.5"}'),
+])
+def test_containers_are_serialized_as_json(result, expected):
+    assert _result_to_str(result) == expected
+
+
+def test_unserializable_containers_fall_back_to_str():
+    result = [2 ** 70]
+    
+    assert _result_to_str(result) == str(result)
+
+
+# Message validation
+
+def test_skip_validation_is_scoped_to_the_block():
+    with skip_validation():
+        validate_messages("not a list")
+    
+    with pytest.raises(ValidationError):
+        validate_messages("not a list")
+
+
+def test_skip_validation_does_not_leak_into_other_threads():
+    errors = []
+    
+    def validate():
+        try:
+            validate_messages([])
+        except ValidationError as e:
+            errors.append(e)
+    
+    with skip_validation():
+        thread = threading.Thread(target=validate)
+        thread.start()
+        thread.join()
+    
+    assert len(errors) == 1
+
+
+def test_skip_validation_does_not_leak_into_other_tasks():
+    async def main():
+        started = asyncio.Event()
+        
+        async def skipping():
+            with skip_validation():
+                started.set()
+                await asyncio.sleep(0)
+                validate_messages([])
+        
+        task = asyncio.create_task(skipping())
+        await started.wait()
+        with pytest.raises(ValidationError):
+            validate_messages([])
+        await task
+    
+    asyncio.run(main())
+
+
+VALID_HISTORY = [
+    {"role": "system", "content": "Be brief."},
+    {"role": "user", "content": [
+        {"type": "text", "text": "What is this?"},
+        {"type": "image", "image_data": "aGVsbG8="},
+    ]},
+    {"role": "assistant", "content": ""},
+    {"role": "tool", "content": "sunny", "tool_call_id": "call_0"},
+]
+
+
+def test_valid_history_takes_the_fast_path():
+    assert _messages_look_valid(VALID_HISTORY)
+    validate_messages(VALID_HISTORY)
+
+
+def user(content):
+    return {"role": "user", "content": content}
+
+
+@pytest.mark.parametrize("messages, error", [
+    ("hello", "Messages must be a list"),
+    ([], "Messages list cannot be empty"),
+    ([user("hi"), "hi"], "Message 1 must be a dictionary"),
+    ([{"content": "hi"}], "Message 0 missing 'role' field"),
+    ([{"role": "user"}], "Message 0 missing 'content' field"),
+    ([{"role": "robot", "content": "hi"}], "Message 0 has invalid role 'robot'"),
+    ([user(42)], "Message 0 content must be string or list"),
+    ([user(["hi"])], "Message 0, content block 0 must be a dictionary"),
+    ([user([{"text": "hi"}])], "Message 0, content block 0 missing 'type' field"),
+    ([user([{"type": "audio"}])], "Message 0, content block 0 has unsupported type 'audio'"),
+    ([user([{"type": "text"}])], "Message 0, content block 0 of type 'text' missing 'text' field"),
+    ([user([{"type": "image"}])], "Message 0, content block 0 of type 'image' missing 'image_data' or 'image_bytes' field"),
+    ([{"role": "tool", "content": "sunny"}], "Message 0 with role 'tool' missing 'tool_call_id' field"),
+])
+def test_malformed_messages_report_the_first_problem(messages, error):
+    with pytest.raises(ValidationError, match=re.escape(error)):
+        validate_messages(messages)
+
+
+def test_unhashable_role_is_a_validation_error():
+    with pytest.raises(ValidationError, match="Message 0 has invalid role"):
+        validate_messages([{"role": ["user"], "content": "hi"}])
+
+
+@pytest.mark.parametrize("block", [
+    {"type": "text", "text": ""},
+    {"type": "image", "image_data": "aGVsbG8="},
+    {"type": "image", "image_bytes": b"hello"},
+])
+def test_blocks_need_one_of_their_required_fields(block):
+    validate_messages([user([block])])
+
+
+def test_unhashable_block_type_is_unsupported():
+    with pytest.raises(ValidationError, match="has unsupported type"):
+        validate_messages([user([{"type": ["text"], "text": "hi"}])])
+
+
+# Text-embedded tool calls
+
+def test_parse_tool_calls_extracts_every_block():
+    content = (
+        'Let me check. <tool_call>{"name": "get_weather", "arguments": {"location": "Paris"}}</tool_call>'
+        '<tool_call>{"name": "get_time", "arguments": "{\\"tz\\": \\"CET\\"}"}</tool_call>'
+        '<tool_call>{"name": "ping"}</tool_call>'
+    )
+    
+    assert parse_tool_calls(content) == [
+        {"id": "call_0", "name": "get_weather", "arguments": '{"location":"Paris"}'},
+        {"id": "call_1", "name": "get_time", "arguments": '{"tz": "CET"}'},
+        {"id": "call_2", "name": "ping", "arguments": "{}"},
+    ]
+
+
+def test_parse_tool_calls_skips_malformed_spans():
+    content = (
+        "<tool_call>not json</tool_call>"
+        "<tool_call>[1, 2]</tool_call>"
+        '<tool_call>{"arguments": {}}</tool_call>'
+        '<tool_call>{"name": "ping", "arguments": {}}</tool_call>'
+        '<tool_call>{"name": "unclosed"'
+    )
+    
+    assert parse_tool_calls(content) == [{"id": "call_0", "name": "ping", "arguments": "{}"}]
+
+
+def test_parse_tool_calls_without_blocks():
+    assert parse_tool_calls("No tools needed.") == []